@@ -2,562 +2,782 @@
 UK Future Works Profile GeoPackage
 Creates a UK Future Works Profile GeoPackage for sharing future works profile data between utility companies and local authorities
 """
+import logging
 import os
 import sys
-from datetime import datetime
-from osgeo import ogr, osr
+from datetime import datetime, timezone
+from osgeo import gdal, ogr, osr
 from typing import Optional, Any
 
+logger = logging.getLogger(__name__)
+
+# Raise GDAL, OGR and OSR errors as Python exceptions, so a failed create or
+# SQL statement stops the build where it happened
+gdal.UseExceptions()
+ogr.UseExceptions()
+osr.UseExceptions()
+
+# SQLite settings applied while the GeoPackage is built: a larger page cache
+# and no per-commit syncing, as the file is recreated from scratch on failure.
+# The pragmas run as the database is opened, before any table exists, which
+# is when page_size has to be set
+SQLITE_CONFIG_OPTIONS = {
+    "OGR_SQLITE_CACHE": "200",
+    "OGR_SQLITE_SYNCHRONOUS": "OFF",
+    "OGR_SQLITE_JOURNAL": "MEMORY",
+    "OGR_SQLITE_PRAGMA": "page_size=8192,temp_store=MEMORY",
+    "SQLITE_USE_OGR_VFS": "YES",
+}
+
+# Identity and lifecycle fields that start every MUDDI feature table. Fields
+# are (name, type) or, for short code-like strings, (name, type, width)
+COMMON_HEADER = [
+    ("systemid", ogr.OFTString),
+    ("lifecyclestatus", ogr.OFTString, 64),
+    ("datelastupdated", ogr.OFTDateTime),
+    ("dateoflastlifecyclestatuschange", ogr.OFTDateTime),
+    ("systemloaddate", ogr.OFTDateTime),
+]
+
+# Standard MUDDI fields shared by the future works tables
+STANDARD_FIELDS = COMMON_HEADER + [
+    ("certification", ogr.OFTString),
+    ("dataproviderassigneduniqueid", ogr.OFTString),
+    ("dataproviderassigneduniqueidautoassigned", ogr.OFTInteger),
+    ("dataowner", ogr.OFTString),
+    ("dataownerassigneduniqueid", ogr.OFTString),
+    ("datasensitivitylevel", ogr.OFTString, 64),
+]
+
+# Standard fields for code list tables. Unlike feature systemids, which
+# providers assign and are often 36-character UUIDs, code list systemids are
+# this profile's own short codes
+CODELIST_FIELDS = [
+    ("systemid", ogr.OFTString, 32),
+    ("systemloaddate", ogr.OFTDateTime),
+    ("datelastupdated", ogr.OFTDateTime),
+    ("versionnumber", ogr.OFTString),
+    ("versiondate", ogr.OFTDateTime),
+    ("value", ogr.OFTString),
+]
+
+# GeoPackage column types for the OGR field types used in SCHEMA, matching
+# the types the GPKG driver itself writes
+SQL_TYPES = {
+    ogr.OFTString: "TEXT",
+    ogr.OFTInteger: "MEDIUMINT",
+    ogr.OFTReal: "REAL",
+    ogr.OFTDate: "DATE",
+    ogr.OFTDateTime: "DATETIME",
+}
+
+# Column defaults, as SQL, for fields that take the same value on nearly
+# every row of a table, so loaders can leave them out of their inserts:
+# table name -> {field name: default}
+FIELD_DEFAULTS = {
+    "plannedprogramme": {
+        "certification": "'Provisional'",
+        "dataproviderassigneduniqueidautoassigned": "1",
+    },
+    "networklink": {
+        "planneddepth_unitofmeasure": "'metres'",
+        "featuretype": "'NetworkLink'",
+    },
+}
+
+# Table definitions: table name -> (geometry type, fields). The code list
+# tables all share CODELIST_FIELDS and are created alongside their values
+SCHEMA = {
+    "organisation": (ogr.wkbNone, COMMON_HEADER + [
+        ("name", ogr.OFTString),
+        ("shortname", ogr.OFTString),
+        ("organisationtype", ogr.OFTString, 64),
+        ("swacode", ogr.OFTString, 8),
+        ("websiteurl", ogr.OFTString),
+    ]),
+    "contactdetails": (ogr.wkbNone, COMMON_HEADER + [
+        ("organisationname", ogr.OFTString),
+        ("contactdetailstype", ogr.OFTString, 64),
+        ("departmentname", ogr.OFTString),
+        ("emailaddress", ogr.OFTString),
+        ("telephonenumber", ogr.OFTString),
+        ("dataproviderid_fk", ogr.OFTString),
+    ]),
+    "plannedprogramme": (ogr.wkbNone, STANDARD_FIELDS + [
+        ("programmename", ogr.OFTString),
+        ("programmetype", ogr.OFTString),
+        ("programmedescription", ogr.OFTString),
+        ("plannedstartdate", ogr.OFTDate),
+        ("plannedenddate", ogr.OFTDate),
+        ("dataproviderid_fk", ogr.OFTString),
+    ]),
+    "networklink": (ogr.wkbLineString, STANDARD_FIELDS + [
+        ("description", ogr.OFTString),
+        ("featuretype", ogr.OFTString),
+        ("utilitytype", ogr.OFTString),
+        ("utilitysubtype", ogr.OFTString),
+        ("plannedinstallationdate", ogr.OFTDate),
+        ("plannedmaterial", ogr.OFTString),
+        ("plannedinstallationmethod", ogr.OFTString),
+        ("planneddepth_depth", ogr.OFTReal),
+        ("planneddepth_unitofmeasure", ogr.OFTString),
+        ("componenttype", ogr.OFTString),
+        ("componentsubtype", ogr.OFTString),
+        ("worktype", ogr.OFTString),
+        ("plannedstartdate", ogr.OFTDate),
+        ("plannedenddate", ogr.OFTDate),
+        ("confidencelevel", ogr.OFTString),
+        ("localereference", ogr.OFTString),
+        ("localereferencetype", ogr.OFTString),
+        ("objectname", ogr.OFTString),
+        ("objectowner", ogr.OFTString),
+        ("operator", ogr.OFTString),
+        ("usrn", ogr.OFTString),
+        ("operationalstatus", ogr.OFTString),
+        ("dataproviderid_fk", ogr.OFTString),
+        ("programmeid_fk", ogr.OFTString),
+        ("conveyancemethod", ogr.OFTString),
+        ("schemestatus", ogr.OFTString),
+        ("cycleschemedetails", ogr.OFTString),
+    ]),
+    "relationship_organisationtocontactdetails": (ogr.wkbNone, COMMON_HEADER + [
+        ("linkedorganisationid", ogr.OFTString),
+        ("linkedcontactdetailsid", ogr.OFTString),
+        ("dataproviderid_fk", ogr.OFTString),
+    ]),
+    "conveyancemethodvalue": (ogr.wkbNone, CODELIST_FIELDS + [
+        ("applicabledomains", ogr.OFTString),
+    ]),
+    # Search aid copied from conveyancemethodvalue.applicabledomains, one row
+    # per domain; not a normalised code list, so it declares no foreign keys
+    "conveyance_domain": (ogr.wkbNone, [
+        ("conveyance_systemid", ogr.OFTString),
+        ("domain", ogr.OFTString),
+    ]),
+}
+
+# Code list tables and their (systemid, value) entries
+CODELISTS = (
+    ("lifecyclestatusvalue", (
+        ("active", "Active"),
+        ("draft", "Draft"),
+        ("under_review", "Under Review"),
+        ("approved", "Approved"),
+        ("superseded", "Superseded"),
+        ("cancelled", "Cancelled"),
+        ("archived", "Archived"),
+    )),
+    ("organisationtypevalue", (
+        ("utility_company", "Utility Company"),
+        ("local_authority", "Local Authority"),
+        ("highway_authority", "Highway Authority"),
+        ("contractor", "Contractor"),
+        ("consultant", "Consultant"),
+        ("regulatory_body", "Regulatory Body"),
+        ("other", "Other"),
+    )),
+    ("contactdetailstypevalue", (
+        ("planning_coordinator", "Planning Coordinator"),
+        ("project_manager", "Project Manager"),
+        ("emergency_contact", "Emergency Contact"),
+        ("asset_protection", "Asset Protection"),
+        ("general_enquiries", "General Enquiries"),
+        ("other", "Other"),
+    )),
+    ("plannedworkstatusvalue", (
+        ("proposed", "Proposed"),
+        ("under_consultation", "Under Consultation"),
+        ("approved", "Approved"),
+        ("scheduled", "Scheduled"),
+        ("in_preparation", "In Preparation"),
+        ("in_progress", "In Progress"),
+        ("completed", "Completed"),
+        ("on_hold", "On Hold"),
+        ("cancelled", "Cancelled"),
+        ("deferred", "Deferred"),
+    )),
+    ("programmetypevalue", (
+        ("capital_investment", "Capital Investment"),
+        ("routine_maintenance", "Routine Maintenance"),
+        ("emergency_preparedness", "Emergency Preparedness"),
+        ("network_expansion", "Network Expansion"),
+        ("asset_replacement", "Asset Replacement"),
+        ("regulatory_compliance", "Regulatory Compliance"),
+        ("customer_connection", "Customer Connection"),
+        ("network_reinforcement", "Network Reinforcement"),
+        ("cycle_network_development", "Cycle Network Development"),
+        ("active_travel_scheme", "Active Travel Scheme"),
+        ("other", "Other"),
+    )),
+    ("worktypevalue", (
+        ("new_installation", "New Installation"),
+        ("full_replacement", "Full Replacement"),
+        ("partial_replacement", "Partial Replacement"),
+        ("upgrade", "Upgrade"),
+        ("repair", "Repair"),
+        ("removal", "Removal"),
+        ("abandonment", "Abandonment"),
+        ("relocation", "Relocation"),
+        ("protection_works", "Protection Works"),
+        ("survey_investigation", "Survey/Investigation"),
+        ("cycle_lane_installation", "Cycle Lane Installation"),
+        ("cycle_path_construction", "Cycle Path Construction"),
+        ("cycle_crossing_upgrade", "Cycle Crossing Upgrade"),
+        ("other", "Other"),
+    )),
+    ("confidencelevelvalue", (
+        ("confirmed", "Confirmed"),
+        ("highly_likely", "Highly Likely"),
+        ("likely", "Likely"),
+        ("possible", "Possible"),
+        ("under_review", "Under Review"),
+        ("tentative", "Tentative"),
+    )),
+    ("utilitytypevalue", (
+        ("electricity", "Electricity"),
+        ("gas", "Gas"),
+        ("water", "Water"),
+        ("sewer", "Sewer"),
+        ("telecommunications", "Telecommunications"),
+        ("district_heating", "District Heating"),
+        ("fuel_and_chemicals", "Fuel and Chemicals"),
+        ("transport_signalling", "Transport Signalling"),
+        ("drainage", "Drainage"),
+        ("cycling_infrastructure", "Cycling Infrastructure"),
+        ("transport_infrastructure", "Transport Infrastructure"),
+        ("other", "Other"),
+    )),
+    ("materialvalue", (
+        ("pe (polyethylene)", "PE (Polyethylene)"),
+        ("pvc", "PVC"),
+        ("ductile iron", "Ductile Iron"),
+        ("steel", "Steel"),
+        ("concrete", "Concrete"),
+        ("clay", "Clay"),
+        ("copper", "Copper"),
+        ("fibre optic", "Fibre Optic"),
+        ("composite", "Composite"),
+        ("hdpe", "HDPE"),
+        ("cast iron", "Cast Iron"),
+        ("unknown", "Unknown"),
+        ("other", "Other"),
+        ("abs", "ABS"),
+        ("asphalt", "Asphalt"),
+        ("aluminium", "Aluminium"),
+        ("asbestos cement", "Asbestos Cement"),
+        ("brick", "Brick"),
+        ("ceramic", "Ceramic"),
+        ("coated steel", "Coated Steel"),
+        ("earthen", "Earthen"),
+        ("fiberglass", "Fiberglass"),
+        ("galvanised iron", "Galvanised Iron"),
+        ("galvanised steel", "Galvanised Steel"),
+        ("geotextile", "Geotextile"),
+        ("gravel", "Gravel"),
+        ("iron", "Iron"),
+        ("ldpe", "LDPE"),
+        ("mdpe", "MDPE"),
+        ("mopc", "MOPC"),
+        ("optical fibre", "Optical Fibre"),
+        ("pex", "PEX"),
+        ("plastic", "Plastic"),
+        ("spun iron", "Spun Iron"),
+        ("stone", "Stone"),
+        ("tile", "Tile"),
+        ("transite", "Transite"),
+        ("upvc", "uPVC"),
+        ("wood", "Wood"),
+        ("lead", "Lead"),
+        ("pitch fibre", "Pitch Fibre"),
+        ("carbon fibre", "Carbon Fibre"),
+    )),
+    ("installationmethodvalue", (
+        ("open_cut", "Open Cut"),
+        ("directional_drilling", "Directional Drilling"),
+        ("moling", "Moling"),
+        ("tunnelling", "Tunnelling"),
+        ("thrust_boring", "Thrust Boring"),
+        ("pipe_jacking", "Pipe Jacking"),
+        ("slip_lining", "Slip Lining"),
+        ("pipe_bursting", "Pipe Bursting"),
+        ("trenching", "Trenching"),
+        ("other", "Other"),
+    )),
+    ("locationtypevalue", (
+        ("carriageway", "Carriageway"),
+        ("footpath", "Footpath"),
+        ("verge", "Verge"),
+        ("cycle_path", "Cycle Path"),
+        ("field", "Field"),
+        ("other", "Other"),
+    )),
+    ("dataprovenancevalue", (
+        ("asset_management_system", "Asset Management System"),
+        ("planning_application", "Planning Application"),
+        ("capital_programme", "Capital Programme"),
+        ("regulatory_submission", "Regulatory Submission"),
+        ("customer_request", "Customer Request"),
+        ("engineering_assessment", "Engineering Assessment"),
+        ("manual_entry", "Manual Entry"),
+        ("other", "Other"),
+    )),
+    ("measurementunitsvalue", (
+        ("metres", "Metres"),
+        ("millimetres", "Millimetres"),
+        ("kilometres", "Kilometres"),
+        ("square_metres", "Square Metres"),
+        ("degrees", "Degrees"),
+        ("bar", "Bar"),
+        ("kv", "kV"),
+        ("unknown", "Unknown"),
+    )),
+    ("datasensitivitylevelvalue", (
+        ("public", "Public"),
+        ("restricted", "Restricted"),
+    )),
+    ("operationalstatusvalue", (
+        ("abandoned", "Abandoned"),
+        ("commissioned", "Commissioned"),
+        ("decommissioned", "Decommissioned"),
+        ("delete_before_installation", "Delete Before Installation"),
+        ("in_service", "In Service"),
+        ("installed", "Installed"),
+        ("other", "Other"),
+        ("out_of_commission", "Out Of Commission"),
+        ("pending_abandonment", "Pending Abandonment"),
+        ("proposed", "Proposed"),
+        ("pending_removal", "Pending Removal"),
+        ("removed", "Removed"),
+        ("under_construction", "Under Construction"),
+        ("unfit_for_service", "Unfit For Service"),
+        ("unknown", "Unknown"),
+    )),
+    ("cycleschemestatus", (
+        ("proposed", "Proposed"),
+        ("feasibility_study", "Feasibility Study"),
+        ("public_consultation", "Public Consultation"),
+        ("approved", "Approved"),
+        ("funded", "Funded"),
+        ("planning_granted", "Planning Granted"),
+        ("in_progress", "In Progress"),
+        ("completed", "Completed"),
+        ("canceled", "Canceled"),
+    )),
+)
+
+# Applicable domain lists shared by several conveyance methods
+DOMAINS_ELECTRICITY = "Electricity"
+DOMAINS_GAS = "Fuel And Chemicals,Gas"
+DOMAINS_PRESSURE = "Fuel And Chemicals,Gas,Water"
+DOMAINS_LIQUID = "Drainage,Fuel And Chemicals,Sewer,Thermal,Water"
+DOMAINS_ALL = "All"
+
+# Conveyance methods as (systemid, value, applicabledomains)
+CONVEYANCE_METHODS = (
+    ("low_pressure", "Low Pressure", DOMAINS_PRESSURE),
+    ("low_voltage", "Low Voltage", DOMAINS_ELECTRICITY),
+    ("pressure", "Pressure", DOMAINS_PRESSURE),
+    ("gravity", "Gravity", DOMAINS_LIQUID),
+    ("high_pressure", "High Pressure", DOMAINS_PRESSURE),
+    ("high_voltage", "High Voltage", DOMAINS_ELECTRICITY),
+    ("unknown", "Unknown", DOMAINS_ALL),
+    ("other", "Other", DOMAINS_ALL),
+    ("syphon", "Syphon", DOMAINS_LIQUID),
+    ("vacuum", "Vacuum", DOMAINS_LIQUID),
+    ("intermediate_voltage", "Intermediate Voltage", DOMAINS_ELECTRICITY),
+    ("medium_voltage", "Medium Voltage", DOMAINS_ELECTRICITY),
+    ("intermediate_pressure", "Intermediate Pressure", DOMAINS_PRESSURE),
+    ("medium_pressure", "Medium Pressure", DOMAINS_GAS),
+    ("pumped", "Pumped", DOMAINS_LIQUID),
+    ("regional_intermediate_pressure", "Regional Intermediate Pressure", DOMAINS_GAS),
+    ("regional_high_pressure", "Regional High Pressure", DOMAINS_GAS),
+    ("extra_high_voltage", "Extra High Voltage", DOMAINS_ELECTRICITY),
+    ("national_high_pressure", "National High Pressure", DOMAINS_PRESSURE),
+)
+
+# The unified future works layer is a view over the base tables, so it
+# takes no storage and always reflects their current contents. nl.fid is
+# exposed first as the integer primary key GeoPackage requires of a view. An
+# organisation can have several contacts, so only its first, by relationship
+# fid, is joined; every link then appears once and fid stays unique
+UNIFIED_VIEW_SQL = """
+    CREATE VIEW future_works_unified AS
+    SELECT 
+        nl.fid as fid,
+        nl.systemid as work_id,
+        nl.objectname as work_name,
+        nl.description,
+        org.name as organisation_name,
+        org.shortname as organisation_shortname,
+        org.organisationtype as organisation_type,
+        org.swacode as swa_code,
+        nl.utilitytype as utility_type,
+        nl.utilitysubtype as utility_subtype,
+        nl.conveyancemethod as conveyance_method,
+        nl.usrn,
+        nl.localereference as street_name,
+        nl.worktype as work_type,
+        nl.plannedstartdate as planned_start_date,
+        nl.plannedenddate as planned_end_date,
+        nl.confidencelevel as confidence_level,
+        nl.plannedmaterial as material,
+        nl.plannedinstallationmethod as installation_method,
+        nl.planneddepth_depth as depth_metres,
+        prog.programmename as programme_name,
+        prog.programmetype as programme_type,
+        cd.contactdetailstype || ' - ' || cd.departmentname as contact_name,
+        cd.emailaddress as contact_email,
+        cd.telephonenumber as contact_phone,
+        nl.datelastupdated as last_updated,
+        nl.datasensitivitylevel as data_sensitivity,
+        nl.operationalstatus as operational_status,
+        nl.geom,
+        nl.schemestatus as scheme_status,
+        nl.cycleschemedetails as cycle_scheme_details
+    FROM networklink nl
+    LEFT JOIN organisation org ON nl.dataproviderid_fk = org.systemid
+    LEFT JOIN plannedprogramme prog ON nl.programmeid_fk = prog.systemid
+    LEFT JOIN contactdetails cd ON cd.systemid = (
+        SELECT rel.linkedcontactdetailsid
+        FROM relationship_organisationtocontactdetails rel
+        WHERE rel.linkedorganisationid = org.systemid
+        ORDER BY rel.fid
+        LIMIT 1
+    )
+    WHERE nl.lifecyclestatus = 'active'
+    """
+
+# Indexes on the key columns joined by UNIFIED_VIEW_SQL, so each join is an
+# index lookup rather than a scan of the joined table, and on the column its
+# WHERE clause filters on. The lifecycle index also carries the planned start
+# date, so the report's date range of the active links is read from the index
+# alone. The conveyance domain index lets the methods applicable to a domain
+# be looked up without scanning conveyance_domain
+JOIN_INDEXES = {
+    "idx_nl_lifecycle": ("networklink", "lifecyclestatus, plannedstartdate"),
+    "idx_networklink_dpid": ("networklink", "dataproviderid_fk"),
+    "idx_networklink_prog": ("networklink", "programmeid_fk"),
+    "idx_rel_org": ("relationship_organisationtocontactdetails", "linkedorganisationid"),
+    "idx_rel_cd": ("relationship_organisationtocontactdetails", "linkedcontactdetailsid"),
+    "idx_org_sysid": ("organisation", "systemid"),
+    "idx_prog_sysid": ("plannedprogramme", "systemid"),
+    "idx_cd_sysid": ("contactdetails", "systemid"),
+    "idx_conveyance_domain": ("conveyance_domain", "domain"),
+}
+
+def gpkg_timestamp():
+    """Return the current time in the GeoPackage DATETIME format OGR writes:
+    UTC, to the millisecond, with a Z suffix"""
+    now = datetime.now(timezone.utc)
+    return now.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+def sql_literal(value):
+    """Format a string, number or None as an SQL literal"""
+    if value is None:
+        return "NULL"
+    if isinstance(value, (int, float)):
+        return str(value)
+    return "'" + value.replace("'", "''") + "'"
+
+def insert_rows_sql(table_name, columns, rows, constants=None):
+    """Build one INSERT ... SELECT statement for a list of rows"""
+    constants = constants or {}
+    
+    # The rows are fed through a VALUES common table expression and any
+    # constant columns are filled in once by the SELECT
+    values_sql = ",".join(
+        "(" + ",".join(sql_literal(value) for value in row) + ")"
+        for row in rows
+    )
+    insert_columns = ",".join(list(columns) + list(constants))
+    select_columns = ",".join(
+        list(columns) + [sql_literal(value) for value in constants.values()]
+    )
+    return (
+        f"INSERT INTO {table_name} ({insert_columns}) "
+        f"WITH v({','.join(columns)}) AS (VALUES {values_sql}) "
+        f"SELECT {select_columns} FROM v"
+    )
+
 class UKFutureWorksProfileGeoPackage:
+    # WKT for British National Grid, resolved from the PROJ database once
+    # and shared by every creator instance
+    _SRS_WKT: Optional[str] = None
+    
     def __init__(self, output_path):
         """Initialise the GeoPackage creator with output path"""
         self.output_path = output_path
         self.driver = ogr.GetDriverByName("GPKG")
         self.ds: Optional[Any] = None
         self.srs = None
+        self.attribute_tables = []
         
         if self.driver is None:
-            raise Exception("GPKG driver not available. Check GDAL installation.")
+            raise RuntimeError("GPKG driver not available. Check GDAL installation.")
     
     def create_geopackage(self):
         """Main method to create the GeoPackage with all tables"""
-        print(f"Creating UK Future Works Profile GeoPackage: {self.output_path}")
+        logger.info("Creating UK Future Works Profile GeoPackage: %s", self.output_path)
         
         # Delete existing file if it exists
         if os.path.exists(self.output_path):
             os.remove(self.output_path)
         
-        # Create new GeoPackage
-        self.ds = self.driver.CreateDataSource(self.output_path)
-        if self.ds is None:
-            raise Exception(f"Failed to create GeoPackage: {self.output_path}")
+        # The GeoPackage is built in memory and written to disk in one go
+        # at the end, instead of as many small writes during the build
+        build_path = f"/vsimem/{os.path.basename(self.output_path)}"
         
-        # Set up British National Grid (EPSG:27700) as default SRS
-        self.srs = osr.SpatialReference()
-        self.srs.ImportFromEPSG(27700)
+        # Start each build with no attribute tables recorded, so a rebuild or
+        # a retry after a failed build registers only the tables it creates
+        self.attribute_tables = []
         
-        try:
-            # Create organisation schema tables
-            self._create_organisation_tables()
+        # Apply the bulk-write SQLite settings for the duration of the build;
+        # the previous config option values are restored on exit
+        with gdal.config_options(SQLITE_CONFIG_OPTIONS):
+            # Create new GeoPackage without the gpkg_ogr_contents table, so
+            # no row-count triggers fire on every insert into the new tables
+            try:
+                self.ds = self.driver.CreateDataSource(
+                    build_path, options=["ADD_GPKG_OGR_CONTENTS=NO"]
+                )
+            except RuntimeError as e:
+                raise OSError(f"Failed to create GeoPackage: {self.output_path}: {e}") from e
             
-            # Create future works tables
-            self._create_future_works_tables()
+            # Set up British National Grid (EPSG:27700) as default SRS
+            self.srs = self._get_srs()
             
-            # Create code list tables
-            self._create_codelist_tables()
+            # Build the whole schema, code list values included, in one
+            # transaction so SQLite only commits once
+            self.ds.StartTransaction()
+            try:
+                # Create organisation schema tables
+                self._create_organisation_tables()
+                
+                # Create future works tables
+                self._create_future_works_tables()
+                
+                # Create code list tables
+                self._create_codelist_tables()
+                
+                # Create relationship tables
+                self._create_relationship_tables()
+                
+                # Register the attribute-only tables in gpkg_contents
+                self._register_attribute_tables()
+                
+                # Index the columns used by the unified view joins
+                self._create_join_indexes()
+                
+                # Create views
+                self._create_views()
+                
+                self.ds.CommitTransaction()
             
-            # Create relationship tables
-            self._create_relationship_tables()
-            
-            # Create views
-            self._create_views()
-            
-            print("GeoPackage created successfully!")
-            
-        except Exception as e:
-            print(f"Error creating GeoPackage: {e}")
-            raise
+            except Exception as e:
+                logger.error("Error creating GeoPackage: %s", e)
+                self.ds.RollbackTransaction()
+                self.ds = None
+                gdal.Unlink(build_path)
+                raise
+            finally:
+                # Close the datasource
+                self.ds = None
+        
+        # Copy the finished GeoPackage from memory to the output path
+        try:
+            gdal.CopyFile(build_path, self.output_path)
+        except RuntimeError as e:
+            raise OSError(f"Failed to write GeoPackage: {self.output_path}: {e}") from e
         finally:
-            # Close the datasource
-            self.ds = None
+            gdal.Unlink(build_path)
+        logger.info("GeoPackage created successfully!")
     
     def _create_organisation_tables(self):
         """Create organisation schema tables"""
-        print("Creating organisation tables...")
-        assert self.ds is not None
+        logger.info("Creating organisation tables...")
         
-        # Create organisation table
-        layer = self.ds.CreateLayer("organisation", geom_type=ogr.wkbNone)
-        self._add_field(layer, "systemid", ogr.OFTString)
-        self._add_field(layer, "lifecyclestatus", ogr.OFTString)
-        self._add_field(layer, "datelastupdated", ogr.OFTDateTime)
-        self._add_field(layer, "dateoflastlifecyclestatuschange", ogr.OFTDateTime)
-        self._add_field(layer, "systemloaddate", ogr.OFTDateTime)
-        self._add_field(layer, "name", ogr.OFTString)
-        self._add_field(layer, "shortname", ogr.OFTString)
-        self._add_field(layer, "organisationtype", ogr.OFTString)
-        self._add_field(layer, "swacode", ogr.OFTString)
-        self._add_field(layer, "websiteurl", ogr.OFTString)
-        
-        # Create contactdetails table
-        layer = self.ds.CreateLayer("contactdetails", geom_type=ogr.wkbNone)
-        self._add_field(layer, "systemid", ogr.OFTString)
-        self._add_field(layer, "lifecyclestatus", ogr.OFTString)
-        self._add_field(layer, "datelastupdated", ogr.OFTDateTime)
-        self._add_field(layer, "dateoflastlifecyclestatuschange", ogr.OFTDateTime)
-        self._add_field(layer, "systemloaddate", ogr.OFTDateTime)
-        self._add_field(layer, "organisationname", ogr.OFTString)
-        self._add_field(layer, "contactdetailstype", ogr.OFTString)
-        self._add_field(layer, "departmentname", ogr.OFTString)
-        self._add_field(layer, "emailaddress", ogr.OFTString)
-        self._add_field(layer, "telephonenumber", ogr.OFTString)
-        self._add_field(layer, "dataproviderid_fk", ogr.OFTString)
+        self._create_table("organisation")
+        self._create_table("contactdetails")
     
     def _create_future_works_tables(self):
         """Create future works specific tables - network link focused"""
-        print("Creating future works tables...")
-        assert self.ds is not None
+        logger.info("Creating future works tables...")
         
-        # Create plannedprogramme table
-        layer = self.ds.CreateLayer("plannedprogramme", geom_type=ogr.wkbNone)
-        self._add_standard_fields(layer)
-        self._add_field(layer, "programmename", ogr.OFTString)
-        self._add_field(layer, "programmetype", ogr.OFTString)
-        self._add_field(layer, "programmedescription", ogr.OFTString)
-        self._add_field(layer, "plannedstartdate", ogr.OFTDate)
-        self._add_field(layer, "plannedenddate", ogr.OFTDate)
-        self._add_field(layer, "dataproviderid_fk", ogr.OFTString)
-        
-        # Create networklink table with linestring geometry
-        layer = self.ds.CreateLayer(
-            "networklink", srs=self.srs, geom_type=ogr.wkbLineString
-        )
-        self._add_standard_fields(layer)
-        self._add_field(layer, "description", ogr.OFTString)
-        self._add_field(layer, "featuretype", ogr.OFTString)
-        self._add_field(layer, "utilitytype", ogr.OFTString)
-        self._add_field(layer, "utilitysubtype", ogr.OFTString)
-        self._add_field(layer, "plannedinstallationdate", ogr.OFTDate)
-        self._add_field(layer, "plannedmaterial", ogr.OFTString)
-        self._add_field(layer, "plannedinstallationmethod", ogr.OFTString)
-        self._add_field(layer, "planneddepth_depth", ogr.OFTReal)
-        self._add_field(layer, "planneddepth_unitofmeasure", ogr.OFTString)
-        self._add_field(layer, "componenttype", ogr.OFTString)
-        self._add_field(layer, "componentsubtype", ogr.OFTString)
-        self._add_field(layer, "worktype", ogr.OFTString)
-        self._add_field(layer, "plannedstartdate", ogr.OFTDate)
-        self._add_field(layer, "plannedenddate", ogr.OFTDate)
-        self._add_field(layer, "confidencelevel", ogr.OFTString)
-        self._add_field(layer, "localereference", ogr.OFTString)
-        self._add_field(layer, "localereferencetype", ogr.OFTString)
-        self._add_field(layer, "objectname", ogr.OFTString)
-        self._add_field(layer, "objectowner", ogr.OFTString)
-        self._add_field(layer, "operator", ogr.OFTString)
-        self._add_field(layer, "usrn", ogr.OFTString)
-        self._add_field(layer, "operationalstatus", ogr.OFTString)
-        self._add_field(layer, "dataproviderid_fk", ogr.OFTString)
-        self._add_field(layer, "programmeid_fk", ogr.OFTString)
-        self._add_field(layer, "conveyancemethod", ogr.OFTString)
-        self._add_field(layer, "schemestatus", ogr.OFTString)
-        self._add_field(layer, "cycleschemedetails", ogr.OFTString)
+        self._create_table("plannedprogramme")
+        self._create_table("networklink")
     
     def _create_relationship_tables(self):
         """Create relationship tables"""
-        print("Creating relationship tables...")
-        assert self.ds is not None
+        logger.info("Creating relationship tables...")
         
         # Organisation to contact details relationship
-        layer = self.ds.CreateLayer(
-            "relationship_organisationtocontactdetails", geom_type=ogr.wkbNone
-        )
-        self._add_field(layer, "systemid", ogr.OFTString)
-        self._add_field(layer, "lifecyclestatus", ogr.OFTString)
-        self._add_field(layer, "datelastupdated", ogr.OFTDateTime)
-        self._add_field(layer, "dateoflastlifecyclestatuschange", ogr.OFTDateTime)
-        self._add_field(layer, "systemloaddate", ogr.OFTDateTime)
-        self._add_field(layer, "linkedorganisationid", ogr.OFTString)
-        self._add_field(layer, "linkedcontactdetailsid", ogr.OFTString)
-        self._add_field(layer, "dataproviderid_fk", ogr.OFTString)
+        self._create_table("relationship_organisationtocontactdetails")
+    
+    def _create_join_indexes(self):
+        """Create indexes on the columns joined by the unified view"""
+        logger.info("Creating join indexes...")
+        assert self.ds is not None
+        
+        for index_name, (table_name, column) in JOIN_INDEXES.items():
+            self.ds.ExecuteSQL(f"CREATE INDEX {index_name} ON {table_name}({column})")
     
     def _create_codelist_tables(self):
         """Create and populate code list tables"""
-        print("Creating and populating code list tables...")
+        logger.info("Creating and populating code list tables...")
         assert self.ds is not None
         
-        # Define code lists and their values
-        codelists = {
-            "lifecyclestatusvalue": [
-                ("active", "Active"),
-                ("draft", "Draft"),
-                ("under_review", "Under Review"),
-                ("approved", "Approved"),
-                ("superseded", "Superseded"),
-                ("cancelled", "Cancelled"),
-                ("archived", "Archived"),
-            ],
-            "organisationtypevalue": [
-                ("utility_company", "Utility Company"),
-                ("local_authority", "Local Authority"),
-                ("highway_authority", "Highway Authority"),
-                ("contractor", "Contractor"),
-                ("consultant", "Consultant"),
-                ("regulatory_body", "Regulatory Body"),
-                ("other", "Other"),
-            ],
-            "contactdetailstypevalue": [
-                ("planning_coordinator", "Planning Coordinator"),
-                ("project_manager", "Project Manager"),
-                ("emergency_contact", "Emergency Contact"),
-                ("asset_protection", "Asset Protection"),
-                ("general_enquiries", "General Enquiries"),
-                ("other", "Other"),
-            ],
-            "plannedworkstatusvalue": [
-                ("proposed", "Proposed"),
-                ("under_consultation", "Under Consultation"),
-                ("approved", "Approved"),
-                ("scheduled", "Scheduled"),
-                ("in_preparation", "In Preparation"),
-                ("in_progress", "In Progress"),
-                ("completed", "Completed"),
-                ("on_hold", "On Hold"),
-                ("cancelled", "Cancelled"),
-                ("deferred", "Deferred"),
-            ],
-            "programmetypevalue": [
-                ("capital_investment", "Capital Investment"),
-                ("routine_maintenance", "Routine Maintenance"),
-                ("emergency_preparedness", "Emergency Preparedness"),
-                ("network_expansion", "Network Expansion"),
-                ("asset_replacement", "Asset Replacement"),
-                ("regulatory_compliance", "Regulatory Compliance"),
-                ("customer_connection", "Customer Connection"),
-                ("network_reinforcement", "Network Reinforcement"),
-                ("cycle_network_development", "Cycle Network Development"),
-                ("active_travel_scheme", "Active Travel Scheme"),
-                ("other", "Other"),
-            ],
-            "worktypevalue": [
-                ("new_installation", "New Installation"),
-                ("full_replacement", "Full Replacement"),
-                ("partial_replacement", "Partial Replacement"),
-                ("upgrade", "Upgrade"),
-                ("repair", "Repair"),
-                ("removal", "Removal"),
-                ("abandonment", "Abandonment"),
-                ("relocation", "Relocation"),
-                ("protection_works", "Protection Works"),
-                ("survey_investigation", "Survey/Investigation"),
-                ("cycle_lane_installation", "Cycle Lane Installation"),
-                ("cycle_path_construction", "Cycle Path Construction"),
-                ("cycle_crossing_upgrade", "Cycle Crossing Upgrade"),
-                ("other", "Other"),
-            ],
-            "confidencelevelvalue": [
-                ("confirmed", "Confirmed"),
-                ("highly_likely", "Highly Likely"),
-                ("likely", "Likely"),
-                ("possible", "Possible"),
-                ("under_review", "Under Review"),
-                ("tentative", "Tentative"),
-            ],
-            "utilitytypevalue": [
-                ("electricity", "Electricity"),
-                ("gas", "Gas"),
-                ("water", "Water"),
-                ("sewer", "Sewer"),
-                ("telecommunications", "Telecommunications"),
-                ("district_heating", "District Heating"),
-                ("fuel_and_chemicals", "Fuel and Chemicals"),
-                ("transport_signalling", "Transport Signalling"),
-                ("drainage", "Drainage"),
-                ("cycling_infrastructure", "Cycling Infrastructure"),
-                ("transport_infrastructure", "Transport Infrastructure"),
-                ("other", "Other"),
-            ],
-            "materialvalue": [
-                ("pe (polyethylene)", "PE (Polyethylene)"),
-                ("pvc", "PVC"),
-                ("ductile iron", "Ductile Iron"),
-                ("steel", "Steel"),
-                ("concrete", "Concrete"),
-                ("clay", "Clay"),
-                ("copper", "Copper"),
-                ("fibre optic", "Fibre Optic"),
-                ("composite", "Composite"),
-                ("hdpe", "HDPE"),
-                ("cast iron", "Cast Iron"),
-                ("unknown", "Unknown"),
-                ("other", "Other"),
-                ("abs", "ABS"),
-                ("asphalt", "Asphalt"),
-                ("aluminium", "Aluminium"),
-                ("asbestos cement", "Asbestos Cement"),
-                ("brick", "Brick"),
-                ("ceramic", "Ceramic"),
-                ("coated steel", "Coated Steel"),
-                ("earthen", "Earthen"),
-                ("fiberglass", "Fiberglass"),
-                ("galvanised iron", "Galvanised Iron"),
-                ("galvanised steel", "Galvanised Steel"),
-                ("geotextile", "Geotextile"),
-                ("gravel", "Gravel"),
-                ("iron", "Iron"),
-                ("ldpe", "LDPE"),
-                ("mdpe", "MDPE"),
-                ("mopc", "MOPC"),
-                ("optical fibre", "Optical Fibre"),
-                ("pex", "PEX"),
-                ("plastic", "Plastic"),
-                ("spun iron", "Spun Iron"),
-                ("stone", "Stone"),
-                ("tile", "Tile"),
-                ("transite", "Transite"),
-                ("upvc", "uPVC"),
-                ("wood", "Wood"),
-                ("lead", "Lead"),
-                ("pitch fibre", "Pitch Fibre"),
-                ("carbon fibre", "Carbon Fibre"),
-            ],
-            "installationmethodvalue": [
-                ("open_cut", "Open Cut"),
-                ("directional_drilling", "Directional Drilling"),
-                ("moling", "Moling"),
-                ("tunnelling", "Tunnelling"),
-                ("thrust_boring", "Thrust Boring"),
-                ("pipe_jacking", "Pipe Jacking"),
-                ("slip_lining", "Slip Lining"),
-                ("pipe_bursting", "Pipe Bursting"),
-                ("trenching", "Trenching"),
-                ("other", "Other"),
-            ],
-            "locationtypevalue": [
-                ("carriageway", "Carriageway"),
-                ("footpath", "Footpath"),
-                ("verge", "Verge"),
-                ("cycle_path", "Cycle Path"),
-                ("field", "Field"),
-                ("other", "Other"),
-            ],
-            "dataprovenancevalue": [
-                ("asset_management_system", "Asset Management System"),
-                ("planning_application", "Planning Application"),
-                ("capital_programme", "Capital Programme"),
-                ("regulatory_submission", "Regulatory Submission"),
-                ("customer_request", "Customer Request"),
-                ("engineering_assessment", "Engineering Assessment"),
-                ("manual_entry", "Manual Entry"),
-                ("other", "Other"),
-            ],
-            "measurementunitsvalue": [
-                ("metres", "Metres"),
-                ("millimetres", "Millimetres"),
-                ("kilometres", "Kilometres"),
-                ("square_metres", "Square Metres"),
-                ("degrees", "Degrees"),
-                ("bar", "Bar"),
-                ("kv", "kV"),
-                ("unknown", "Unknown"),
-            ],
-            "datasensitivitylevelvalue": [
-                ("public", "Public"),
-                ("restricted", "Restricted"),
-            ],
-            "operationalstatusvalue": [
-                ("abandoned", "Abandoned"),
-                ("commissioned", "Commissioned"),
-                ("decommissioned", "Decommissioned"),
-                ("delete_before_installation", "Delete Before Installation"),
-                ("in_service", "In Service"),
-                ("installed", "Installed"),
-                ("other", "Other"),
-                ("out_of_commission", "Out Of Commission"),
-                ("pending_abandonment", "Pending Abandonment"),
-                ("proposed", "Proposed"),
-                ("pending_removal", "Pending Removal"),
-                ("removed", "Removed"),
-                ("under_construction", "Under Construction"),
-                ("unfit_for_service", "Unfit For Service"),
-                ("unknown", "Unknown"),
-            ],
-            "cycleschemestatus": [
-                ("proposed", "Proposed"),
-                ("feasibility_study", "Feasibility Study"),
-                ("public_consultation", "Public Consultation"),
-                ("approved", "Approved"),
-                ("funded", "Funded"),
-                ("planning_granted", "Planning Granted"),
-                ("in_progress", "In Progress"),
-                ("completed", "Completed"),
-                ("canceled", "Canceled"),
-            ],
-        }
-        
         # Create conveyancemethodvalue separately as it has an extra field
-        layer = self.ds.CreateLayer("conveyancemethodvalue", geom_type=ogr.wkbNone)
-        self._add_codelist_fields(layer)
-        self._add_field(layer, "applicabledomains", ogr.OFTString)
+        self._create_table("conveyancemethodvalue")
         
-        # Populate conveyancemethodvalue
-        conveyancemethods = [
-            ("low_pressure", "Low Pressure", "Fuel And Chemicals,Gas,Water"),
-            ("low_voltage", "Low Voltage", "Electricity"),
-            ("pressure", "Pressure", "Fuel And Chemicals,Gas,Water"),
-            ("gravity", "Gravity", "Drainage,Fuel And Chemicals,Sewer,Thermal,Water"),
-            ("high_pressure", "High Pressure", "Fuel And Chemicals,Gas,Water"),
-            ("high_voltage", "High Voltage", "Electricity"),
-            ("unknown", "Unknown", "All"),
-            ("other", "Other", "All"),
-            ("syphon", "Syphon", "Drainage,Fuel And Chemicals,Sewer,Thermal,Water"),
-            ("vacuum", "Vacuum", "Drainage,Fuel And Chemicals,Sewer,Thermal,Water"),
-            ("intermediate_voltage", "Intermediate Voltage", "Electricity"),
-            ("medium_voltage", "Medium Voltage", "Electricity"),
-            ("intermediate_pressure", "Intermediate Pressure", "Fuel And Chemicals,Gas,Water"),
-            ("medium_pressure", "Medium Pressure", "Fuel And Chemicals,Gas"),
-            ("pumped", "Pumped", "Drainage,Fuel And Chemicals,Sewer,Thermal,Water"),
-            ("regional_intermediate_pressure", "Regional Intermediate Pressure", "Fuel And Chemicals,Gas"),
-            ("regional_high_pressure", "Regional High Pressure", "Fuel And Chemicals,Gas"),
-            ("extra_high_voltage", "Extra High Voltage", "Electricity"),
-            ("national_high_pressure", "National High Pressure", "Fuel And Chemicals,Gas,Water"),
-        ]
+        # The applicable domains of each conveyance method are also stored
+        # one per row, so they can be filtered on through an index. This is a
+        # search aid only: applicabledomains stays the source of truth, and
+        # the domain names are free text that don't all match a utility type
+        self._create_table("conveyance_domain")
         
-        for systemid, value, domains in conveyancemethods:
-            feature = ogr.Feature(layer.GetLayerDefn())
-            feature.SetField("systemid", systemid)
-            feature.SetField("value", value)
-            feature.SetField("applicabledomains", domains)
-            feature.SetField("systemloaddate", datetime.now().isoformat())
-            feature.SetField("datelastupdated", datetime.now().isoformat())
-            layer.CreateFeature(feature)
-            feature = None
+        # All code list rows share a single load timestamp
+        now_iso = gpkg_timestamp()
         
-        # Create and populate other code list tables
-        for table_name, values in codelists.items():
-            layer = self.ds.CreateLayer(table_name, geom_type=ogr.wkbNone)
-            self._add_codelist_fields(layer)
-            
-            # Populate with values
-            for systemid, value in values:
-                feature = ogr.Feature(layer.GetLayerDefn())
-                feature.SetField("systemid", systemid)
-                feature.SetField("value", value)
-                feature.SetField("systemloaddate", datetime.now().isoformat())
-                feature.SetField("datelastupdated", datetime.now().isoformat())
-                layer.CreateFeature(feature)
-                feature = None
+        # Each code list is inserted with a single INSERT ... SELECT rather
+        # than one CreateFeature call per value; the shared timestamps are
+        # added by the SELECT instead of being repeated in every row
+        timestamps = {"systemloaddate": now_iso, "datelastupdated": now_iso}
+        self.ds.ExecuteSQL(
+            insert_rows_sql(
+                "conveyancemethodvalue",
+                ("systemid", "value", "applicabledomains"),
+                CONVEYANCE_METHODS,
+                timestamps,
+            )
+        )
+        self.ds.ExecuteSQL(
+            insert_rows_sql(
+                "conveyance_domain",
+                ("conveyance_systemid", "domain"),
+                [
+                    (systemid, domain)
+                    for systemid, _, domains in CONVEYANCE_METHODS
+                    for domain in domains.split(",")
+                ],
+            )
+        )
+        
+        # Create and populate the other code list tables
+        for table_name, values in CODELISTS:
+            self._create_attribute_table(table_name, CODELIST_FIELDS)
+            self.ds.ExecuteSQL(
+                insert_rows_sql(table_name, ("systemid", "value"), values, timestamps)
+            )
     
     def _create_views(self):
         """Create database views using SQL"""
-        print("Creating views...")
+        logger.info("Creating views...")
         assert self.ds is not None
         
-        # Create a unified future works table that combines all necessary data
-        # This will be the ONLY table visible to end users
-        layer = self.ds.CreateLayer(
-            "future_works_unified", srs=self.srs, geom_type=ogr.wkbLineString
+        # Create a unified future works view that combines all necessary data
+        # This will be the ONLY layer visible to end users
+        self.ds.ExecuteSQL(UNIFIED_VIEW_SQL, dialect="SQLITE")
+        
+        # Register the view as a feature layer so GeoPackage readers list it
+        self.ds.ExecuteSQL(
+            "INSERT INTO gpkg_contents (table_name, data_type, identifier, srs_id) "
+            "VALUES ('future_works_unified', 'features', 'future_works_unified', 27700)"
+        )
+        self.ds.ExecuteSQL(
+            "INSERT INTO gpkg_geometry_columns "
+            "(table_name, column_name, geometry_type_name, srs_id, z, m) "
+            "VALUES ('future_works_unified', 'geom', 'LINESTRING', 27700, 0, 0)"
         )
         
-        # Add all the fields users need to see
-        self._add_field(layer, "work_id", ogr.OFTString)
-        self._add_field(layer, "work_name", ogr.OFTString)
-        self._add_field(layer, "description", ogr.OFTString)
-        self._add_field(layer, "organisation_name", ogr.OFTString)
-        self._add_field(layer, "organisation_shortname", ogr.OFTString)
-        self._add_field(layer, "organisation_type", ogr.OFTString)
-        self._add_field(layer, "swa_code", ogr.OFTString)
-        self._add_field(layer, "utility_type", ogr.OFTString)
-        self._add_field(layer, "utility_subtype", ogr.OFTString)
-        self._add_field(layer, "conveyance_method", ogr.OFTString)
-        self._add_field(layer, "usrn", ogr.OFTString)
-        self._add_field(layer, "street_name", ogr.OFTString)
-        self._add_field(layer, "work_type", ogr.OFTString)
-        self._add_field(layer, "planned_start_date", ogr.OFTDate)
-        self._add_field(layer, "planned_end_date", ogr.OFTDate)
-        self._add_field(layer, "confidence_level", ogr.OFTString)
-        self._add_field(layer, "material", ogr.OFTString)
-        self._add_field(layer, "installation_method", ogr.OFTString)
-        self._add_field(layer, "depth_metres", ogr.OFTReal)
-        self._add_field(layer, "programme_name", ogr.OFTString)
-        self._add_field(layer, "programme_type", ogr.OFTString)
-        self._add_field(layer, "contact_name", ogr.OFTString)
-        self._add_field(layer, "contact_email", ogr.OFTString)
-        self._add_field(layer, "contact_phone", ogr.OFTString)
-        self._add_field(layer, "last_updated", ogr.OFTDateTime)
-        self._add_field(layer, "data_sensitivity", ogr.OFTString)
-        self._add_field(layer, "operational_status", ogr.OFTString)  # Added this field
-        self._add_field(layer, "scheme_status", ogr.OFTString)
-        self._add_field(layer, "cycle_scheme_details", ogr.OFTString)
+        # Kept for callers that read the SQL from the creator
+        self.unified_view_sql = UNIFIED_VIEW_SQL
+    
+    def _get_srs(self):
+        """Return the shared British National Grid (EPSG:27700) SRS"""
+        if self.srs is None:
+            cls = type(self)
+            self.srs = osr.SpatialReference()
+            if cls._SRS_WKT is None:
+                self.srs.ImportFromEPSG(27700)
+                cls._SRS_WKT = self.srs.ExportToWkt()
+            else:
+                self.srs.ImportFromWkt(cls._SRS_WKT)
+        return self.srs
+    
+    def _create_table(self, table_name):
+        """Create a table from its SCHEMA definition"""
+        geom_type, fields = SCHEMA[table_name]
+        if geom_type == ogr.wkbNone:
+            self._create_attribute_table(table_name, fields)
+        else:
+            self._create_layer(table_name, geom_type, fields)
+    
+    def _create_attribute_table(self, table_name, fields):
+        """Create a table without geometry using a single CREATE TABLE"""
+        assert self.ds is not None
         
-        # Store the SQL for the populate script to execute
-        self.unified_view_sql = """
-        INSERT INTO future_works_unified (
-            work_id, work_name, description,
-            organisation_name, organisation_shortname, organisation_type, swa_code,
-            utility_type, utility_subtype, conveyance_method, usrn, street_name, work_type,
-            planned_start_date, planned_end_date, confidence_level,
-            material, installation_method, depth_metres,
-            programme_name, programme_type,
-            contact_name, contact_email, contact_phone,
-            last_updated, data_sensitivity, operational_status, geom,
-            scheme_status, cycle_scheme_details
+        # Every column is declared in the one statement, rather than OGR
+        # adding each field with its own ALTER TABLE
+        defaults = FIELD_DEFAULTS.get(table_name, {})
+        columns_sql = ", ".join(
+            f"{name} {SQL_TYPES[field_type]}"
+            + (f"({width[0]})" if width else "")
+            + (f" DEFAULT {defaults[name]}" if name in defaults else "")
+            for name, field_type, *width in fields
         )
-        SELECT 
-            nl.systemid as work_id,
-            nl.objectname as work_name,
-            nl.description,
-            org.name as organisation_name,
-            org.shortname as organisation_shortname,
-            org.organisationtype as organisation_type,
-            org.swacode as swa_code,
-            nl.utilitytype as utility_type,
-            nl.utilitysubtype as utility_subtype,
-            nl.conveyancemethod as conveyance_method,
-            nl.usrn,
-            nl.localereference as street_name,
-            nl.worktype as work_type,
-            nl.plannedstartdate as planned_start_date,
-            nl.plannedenddate as planned_end_date,
-            nl.confidencelevel as confidence_level,
-            nl.plannedmaterial as material,
-            nl.plannedinstallationmethod as installation_method,
-            nl.planneddepth_depth as depth_metres,
-            prog.programmename as programme_name,
-            prog.programmetype as programme_type,
-            cd.contactdetailstype || ' - ' || cd.departmentname as contact_name,
-            cd.emailaddress as contact_email,
-            cd.telephonenumber as contact_phone,
-            nl.datelastupdated as last_updated,
-            nl.datasensitivitylevel as data_sensitivity,
-            nl.operationalstatus as operational_status,
-            nl.geom,
-            nl.schemestatus as scheme_status,
-            nl.cycleschemedetails as cycle_scheme_details
-        FROM networklink nl
-        LEFT JOIN organisation org ON nl.dataproviderid_fk = org.systemid
-        LEFT JOIN plannedprogramme prog ON nl.programmeid_fk = prog.systemid
-        LEFT JOIN relationship_organisationtocontactdetails rel ON org.systemid = rel.linkedorganisationid
-        LEFT JOIN contactdetails cd ON rel.linkedcontactdetailsid = cd.systemid
-        WHERE nl.lifecyclestatus = 'Active'
-        """
-        
-        # Note: This SQL will be run by the populate script
-        print("Note: The unified view SQL has been prepared but needs to be executed after data population.")
-        print("SQL stored in self.unified_view_sql for use by the populate script.")
+        self.ds.ExecuteSQL(
+            f"CREATE TABLE {table_name} "
+            f"(fid INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL, {columns_sql})"
+        )
+        self.attribute_tables.append(table_name)
     
-    def _add_standard_fields(self, layer):
-        """Add standard MUDDI fields to a layer"""
-        self._add_field(layer, "systemid", ogr.OFTString)
-        self._add_field(layer, "lifecyclestatus", ogr.OFTString)
-        self._add_field(layer, "datelastupdated", ogr.OFTDateTime)
-        self._add_field(layer, "dateoflastlifecyclestatuschange", ogr.OFTDateTime)
-        self._add_field(layer, "systemloaddate", ogr.OFTDateTime)
-        self._add_field(layer, "certification", ogr.OFTString)
-        self._add_field(layer, "dataproviderassigneduniqueid", ogr.OFTString)
-        self._add_field(
-            layer, "dataproviderassigneduniqueidautoassigned", ogr.OFTInteger
+    def _register_attribute_tables(self):
+        """Add the gpkg_contents rows for the attribute tables in one INSERT"""
+        assert self.ds is not None
+        
+        self.ds.ExecuteSQL(
+            insert_rows_sql(
+                "gpkg_contents",
+                ("table_name", "data_type", "identifier"),
+                [
+                    (table_name, "attributes", table_name)
+                    for table_name in self.attribute_tables
+                ],
+            )
         )
-        self._add_field(layer, "dataowner", ogr.OFTString)
-        self._add_field(layer, "dataownerassigneduniqueid", ogr.OFTString)
-        self._add_field(layer, "datasensitivitylevel", ogr.OFTString)
     
-    def _add_codelist_fields(self, layer):
-        """Add standard fields for code list tables"""
-        self._add_field(layer, "systemid", ogr.OFTString)
-        self._add_field(layer, "systemloaddate", ogr.OFTDateTime)
-        self._add_field(layer, "datelastupdated", ogr.OFTDateTime)
-        self._add_field(layer, "versionnumber", ogr.OFTString)
-        self._add_field(layer, "versiondate", ogr.OFTDateTime)
-        self._add_field(layer, "value", ogr.OFTString)
+    def _create_layer(self, table_name, geom_type, fields):
+        """Create a geometry layer with the given geometry type and fields"""
+        assert self.ds is not None
+        
+        # Spatial indexes are built by the populate script once the
+        # geometries are loaded, rather than being maintained by
+        # triggers on every insert
+        layer = self.ds.CreateLayer(
+            table_name,
+            srs=self._get_srs(),
+            geom_type=geom_type,
+            options=["SPATIAL_INDEX=NO"],
+        )
+        
+        self._add_fields(layer, fields, FIELD_DEFAULTS.get(table_name, {}))
+        return layer
     
-    def _add_field(self, layer, name, field_type, width=None):
-        """Add a field to a layer"""
-        field_defn = ogr.FieldDefn(name, field_type)
-        if width:
-            field_defn.SetWidth(width)
-        layer.CreateField(field_defn)
+    def _add_fields(self, layer, fields, defaults):
+        """Add a list of (name, type) or (name, type, width) fields to a layer"""
+        for name, field_type, *width in fields:
+            field_defn = ogr.FieldDefn(name, field_type)
+            if width:
+                field_defn.SetWidth(width[0])
+            if name in defaults:
+                field_defn.SetDefault(defaults[name])
+            layer.CreateField(field_defn)
 
 def main():
     """Main function"""
+    # Progress is logged to stdout alongside the printed output
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    
     # Default output path
     output_path = "uk_future_works_example.gpkg"
     
@@ -576,12 +796,12 @@ def main():
     print("- Relationship tables: relationship_organisationtocontactdetails")
     print("- Code list tables: 16 reference tables populated with values")
     print("  Including: operationalstatusvalue, conveyancemethodvalue, materialvalue (expanded)")
-    print("- Unified table: future_works_unified (contains all joined data)")
+    print("  Plus conveyance_domain: the applicable domains of each conveyance method")
+    print("- Unified view: future_works_unified (contains all joined data)")
     print(
         "\nThe main table to use is 'future_works_unified' which contains all information in one place."
     )
-    print("\nIMPORTANT: The unified view needs to be populated after data is loaded into the base tables.")
-    print("The SQL for this is available in the creator.unified_view_sql property.")
+    print("\nThe unified view reads directly from the base tables, so it is always up to date.")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -5,60 +5,181 @@ This script is used to populate the GeoPackage with sample data for testing and
 It is not intended to be used in production.
 """
 
-import os
+import io
+import logging
+import struct
 import sys
-from datetime import datetime, timedelta
-from osgeo import ogr, osr
+from datetime import date, datetime, timedelta
+from osgeo import gdal, ogr
 from typing import Optional, Any
 
+from create_uk_future_works_profile import gpkg_timestamp, insert_rows_sql
+
+logger = logging.getLogger(__name__)
+
+# Raise GDAL and OGR errors as Python exceptions, so a failed open, insert or
+# query stops the run where it happened instead of returning None or an error
+# code for the next call to trip over
+gdal.UseExceptions()
+ogr.UseExceptions()
+
+# SQLite settings applied whenever the GeoPackage is opened for population
+SQLITE_CONFIG_OPTIONS = {
+    "OGR_SQLITE_CACHE": "200",
+    "OGR_SQLITE_PRAGMA": "temp_store=MEMORY",
+    "SQLITE_USE_OGR_VFS": "YES",
+}
+
+# Additional settings for bulk load mode: the sample data is loaded by a
+# single writer into a freshly created file that can simply be recreated if
+# the load fails, so durability and constraint checking are traded for speed
+BULK_LOAD_CONFIG_OPTIONS = {
+    "OGR_SQLITE_SYNCHRONOUS": "OFF",
+    "OGR_SQLITE_JOURNAL": "MEMORY",
+}
+
+# Pragmas run in bulk load mode in addition to the base OGR_SQLITE_PRAGMA ones
+BULK_LOAD_PRAGMAS = "ignore_check_constraints=ON"
+
+# Rule printed above and below the summary report's title
+SEPARATOR = "=" * 60
+
+# Day offsets from today used for the sample planned start and end dates
+PLANNED_DATE_OFFSETS = (
+    30, 45, 50, 55, 60, 65, 70, 75, 80, 90,
+    95, 100, 120, 130, 150, 180, 200, 240, 300, 365,
+)
+
 
 class UKFutureWorksProfileGeoPackagePopulate:
-    def __init__(self, geopackage_path):
-        """Initialise the populator with the GeoPackage path"""
+    # WKB line headers keyed by point count, shared across instances
+    _WKB_HEADERS: dict = {}
+
+    def __init__(self, geopackage_path, bulk_load: bool = True):
+        """Initialise the populator with the GeoPackage path
+
+        With bulk_load the load runs without syncing, journaling to disk or
+        checking constraints, so a failed load leaves a GeoPackage that
+        should be recreated rather than reused.
+        """
         self.geopackage_path = geopackage_path
+        self.bulk_load = bulk_load
         self.ds: Optional[Any] = None
-        self.srs = None
+        self._date_at: dict = {}
+        self._now_iso = ""
+
+    def __enter__(self):
+        """Open the GeoPackage once for everything run inside the with block"""
+        self.ds = self._open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the GeoPackage"""
+        self._close()
+
+    def _open(self, bulk_load=None):
+        """Open the GeoPackage for update, in bulk load mode unless told not to"""
+        if bulk_load is None:
+            bulk_load = self.bulk_load
+        config_options = dict(SQLITE_CONFIG_OPTIONS)
+        if bulk_load:
+            config_options.update(BULK_LOAD_CONFIG_OPTIONS)
+            config_options["OGR_SQLITE_PRAGMA"] += f",{BULK_LOAD_PRAGMAS}"
+
+        # The SQLite settings are applied as the connection is opened and
+        # last for as long as it stays open
+        with gdal.config_options(config_options):
+            # Only the tables registered in gpkg_contents are needed as layers,
+            # and a failed open reports why in the raised error
+            try:
+                return gdal.OpenEx(
+                    self.geopackage_path,
+                    gdal.OF_VECTOR | gdal.OF_UPDATE | gdal.OF_VERBOSE_ERROR,
+                    open_options=["LIST_ALL_TABLES=NO"],
+                )
+            except RuntimeError as e:
+                raise OSError(
+                    f"Failed to open GeoPackage: {self.geopackage_path}: {e}"
+                ) from e
+
+    def _close(self):
+        """Close a GeoPackage opened for update"""
+        assert self.ds is not None
+
+        # SQLite's recommended last step before closing a connection that
+        # changed data: re-analyse any tables whose statistics went stale
+        self.ds.ExecuteSQL("PRAGMA optimize", dialect="SQLITE")
+        self.ds = None
 
     def populate_geopackage(self):
         """Main method to populate the GeoPackage with sample data"""
-        print(f"Populating UK Future Works Profile GeoPackage: {self.geopackage_path}")
-
-        # Open the GeoPackage
-        self.ds = ogr.Open(self.geopackage_path, 1)  # 1 = open in update mode!!
-        if self.ds is None:
-            raise Exception(f"Failed to open GeoPackage: {self.geopackage_path}")
+        logger.info(
+            "Populating UK Future Works Profile GeoPackage: %s", self.geopackage_path
+        )
 
-        # Set up British National Grid (EPSG:27700)
-        self.srs = osr.SpatialReference()
-        self.srs.ImportFromEPSG(27700)
+        # Outside a with block the GeoPackage is opened just for this call
+        owns_ds = self.ds is None
+        if owns_ds:
+            self.ds = self._open()
 
-        try:
-            # Populate tables in order
-            self._populate_organisations()
-            self._populate_contact_details()
-            self._populate_organisation_relationships()
-            self._populate_planned_programmes()
-            self._populate_network_links()
+        # Every row of every table shares one load timestamp, already in the
+        # format OGR writes, so the SQL inserts and the network links match
+        self._now_iso = gpkg_timestamp()
 
-            # Populate the unified table with all joined data
-            self._populate_unified_table()
+        # Work out every planned date from the same day up front, so start and
+        # end dates can't straddle midnight
+        today = date.today()
+        self._date_at = {
+            days: (today + timedelta(days=days)).isoformat()
+            for days in PLANNED_DATE_OFFSETS
+        }
 
-            print("GeoPackage populated successfully!")
+        try:
+            # Load every table in one transaction so the whole run is
+            # committed, and synced, once
+            self.ds.StartTransaction()
+            try:
+                # Populate tables in order
+                self._populate_organisations()
+                self._populate_contact_details()
+                self._populate_organisation_relationships()
+                self._populate_planned_programmes()
+                self._populate_network_links()
+
+                # Build the spatial indexes now that all geometries are loaded
+                self.finalize_spatial_indexes()
+
+                self.ds.CommitTransaction()
+            except Exception:
+                self.ds.RollbackTransaction()
+                raise
+
+            # Gather statistics on the loaded tables so SQLite can plan the
+            # unified view's joins around the join key indexes
+            self.ds.ExecuteSQL("ANALYZE", dialect="SQLITE")
+
+            logger.info("GeoPackage populated successfully!")
 
         except Exception as e:
-            print(f"Error populating GeoPackage: {e}")
+            logger.error("Error populating GeoPackage: %s", e)
             raise
         finally:
-            # Close the datasource
-            self.ds = None
+            # Close the datasource unless it belongs to a with block
+            if owns_ds:
+                self._close()
 
     def _populate_organisations(self):
         """Populate organisation table with sample utility companies"""
-        print("Populating organisations...")
-        assert self.ds is not None
-
-        layer = self.ds.GetLayerByName("organisation")
-
+        logger.info("Populating organisations...")
+
+        org_fields = (
+            "systemid",
+            "name",
+            "shortname",
+            "organisationtype",
+            "swacode",
+            "websiteurl",
+        )
         organisations = [
             {
                 "systemid": "org-001",
@@ -102,93 +223,79 @@ class UKFutureWorksProfileGeoPackagePopulate:
             },
         ]
 
-        for org_data in organisations:
-            feature = ogr.Feature(layer.GetLayerDefn())
-            feature.SetField("systemid", org_data["systemid"])
-            feature.SetField("lifecyclestatus", "active")  
-            feature.SetField("datelastupdated", datetime.now().isoformat())
-            feature.SetField("dateoflastlifecyclestatuschange", datetime.now().isoformat())
-            feature.SetField("systemloaddate", datetime.now().isoformat())
-            feature.SetField("name", org_data["name"])
-            feature.SetField("shortname", org_data["shortname"])
-            feature.SetField("organisationtype", org_data["organisationtype"])
-            feature.SetField("swacode", org_data["swacode"])
-            feature.SetField("websiteurl", org_data["websiteurl"])
-            layer.CreateFeature(feature)
-            feature = None
+        self._insert_rows(
+            "organisation",
+            org_fields,
+            [tuple(org[f] for f in org_fields) for org in organisations],
+        )
 
     def _populate_contact_details(self):
         """Populate contact details for organisations"""
-        print("Populating contact details...")
-        assert self.ds is not None
-
-        layer = self.ds.GetLayerByName("contactdetails")
-
+        logger.info("Populating contact details...")
+
+        contact_fields = (
+            "systemid",
+            "organisationname",
+            "contactdetailstype",
+            "departmentname",
+            "emailaddress",
+            "telephonenumber",
+            "dataproviderid_fk",
+        )
         contacts = [
-            {
-                "systemid": "ctc-001",
-                "organisationname": "Northern Gas Networks",
-                "contactdetailstype": "planning_coordinator",  
-                "departmentname": "Network Planning",
-                "emailaddress": "planning@northerngas.co.uk",
-                "telephonenumber": "0800 040 7766",
-                "dataproviderid_fk": "org-001",
-            },
-            {
-                "systemid": "ctc-002",
-                "organisationname": "Yorkshire Water Services",
-                "contactdetailstype": "asset_protection",  
-                "departmentname": "Asset Management",
-                "emailaddress": "assetprotection@yorkshirewater.co.uk",
-                "telephonenumber": "0345 124 2424",
-                "dataproviderid_fk": "org-002",
-            },
-            {
-                "systemid": "ctc-003",
-                "organisationname": "Northern Powergrid",
-                "contactdetailstype": "project_manager",  
-                "departmentname": "Capital Projects",
-                "emailaddress": "projects@northernpowergrid.com",
-                "telephonenumber": "0800 011 3332",
-                "dataproviderid_fk": "org-003",
-            },
-            {
-                "systemid": "ctc-004",
-                "organisationname": "BT Openreach",
-                "contactdetailstype": "planning_coordinator",  
-                "departmentname": "Network Development",
-                "emailaddress": "networkplanning@openreach.co.uk",
-                "telephonenumber": "0800 023 2023",
-                "dataproviderid_fk": "org-004",
-            },
-            {
-                "systemid": "ctc-005",
-                "organisationname": "Leeds City Council Highways",
-                "contactdetailstype": "emergency_contact",  
-                "departmentname": "Highway Services",
-                "emailaddress": "highways@leeds.gov.uk",
-                "telephonenumber": "0113 222 4444",
-                "dataproviderid_fk": "org-005",
-            },
+            (
+                "ctc-001",
+                "Northern Gas Networks",
+                "planning_coordinator",  
+                "Network Planning",
+                "planning@northerngas.co.uk",
+                "0800 040 7766",
+                "org-001",
+            ),
+            (
+                "ctc-002",
+                "Yorkshire Water Services",
+                "asset_protection",  
+                "Asset Management",
+                "assetprotection@yorkshirewater.co.uk",
+                "0345 124 2424",
+                "org-002",
+            ),
+            (
+                "ctc-003",
+                "Northern Powergrid",
+                "project_manager",  
+                "Capital Projects",
+                "projects@northernpowergrid.com",
+                "0800 011 3332",
+                "org-003",
+            ),
+            (
+                "ctc-004",
+                "BT Openreach",
+                "planning_coordinator",  
+                "Network Development",
+                "networkplanning@openreach.co.uk",
+                "0800 023 2023",
+                "org-004",
+            ),
+            (
+                "ctc-005",
+                "Leeds City Council Highways",
+                "emergency_contact",  
+                "Highway Services",
+                "highways@leeds.gov.uk",
+                "0113 222 4444",
+                "org-005",
+            ),
         ]
 
-        for contact_data in contacts:
-            feature = ogr.Feature(layer.GetLayerDefn())
-            for field, value in contact_data.items():
-                feature.SetField(field, value)
-            feature.SetField("lifecyclestatus", "active")  
-            feature.SetField("datelastupdated", datetime.now().isoformat())
-            feature.SetField("dateoflastlifecyclestatuschange", datetime.now().isoformat())
-            feature.SetField("systemloaddate", datetime.now().isoformat())
-            layer.CreateFeature(feature)
-            feature = None
+        # Each contact is a tuple of values in contact_fields order
+        self._insert_rows("contactdetails", contact_fields, contacts)
 
     def _populate_organisation_relationships(self):
         """Populate organisation to contact relationships"""
-        print("Populating organisation relationships...")
-        assert self.ds is not None
-
-        layer = self.ds.GetLayerByName("relationship_organisationtocontactdetails")
+        logger.info("Populating organisation relationships...")
 
         relationships = [
             ("rel-001", "org-001", "ctc-001", "org-001"),
@@ -198,120 +305,107 @@ class UKFutureWorksProfileGeoPackagePopulate:
             ("rel-005", "org-005", "ctc-005", "org-005"),
         ]
 
-        for rel_id, org_id, contact_id, provider_id in relationships:
-            feature = ogr.Feature(layer.GetLayerDefn())
-            feature.SetField("systemid", rel_id)
-            feature.SetField("lifecyclestatus", "active")  
-            feature.SetField("datelastupdated", datetime.now().isoformat())
-            feature.SetField("dateoflastlifecyclestatuschange", datetime.now().isoformat())
-            feature.SetField("systemloaddate", datetime.now().isoformat())
-            feature.SetField("linkedorganisationid", org_id)
-            feature.SetField("linkedcontactdetailsid", contact_id)
-            feature.SetField("dataproviderid_fk", provider_id)
-            layer.CreateFeature(feature)
-            feature = None
+        self._insert_rows(
+            "relationship_organisationtocontactdetails",
+            (
+                "systemid",
+                "linkedorganisationid",
+                "linkedcontactdetailsid",
+                "dataproviderid_fk",
+            ),
+            relationships,
+        )
 
     def _populate_planned_programmes(self):
         """Populate planned programmes"""
-        print("Populating planned programmes...")
-        assert self.ds is not None
-
-        layer = self.ds.GetLayerByName("plannedprogramme")
-
+        logger.info("Populating planned programmes...")
+
+        date_at = self._date_at
+
+        programme_fields = (
+            "systemid",
+            "programmename",
+            "programmetype",
+            "programmedescription",
+            "plannedstartdate",
+            "plannedenddate",
+            "dataproviderid_fk",
+            "datasensitivitylevel",
+        )
         programmes = [
-            {
-                "systemid": "prg-001",
-                "programmename": "Leeds City Centre Gas Main Replacement 2025",
-                "programmetype": "asset_replacement",  
-                "programmedescription": "Replacement of aging cast iron mains with modern PE pipes in Leeds city centre",
-                "plannedstartdate": (datetime.now() + timedelta(days=60)).strftime(
-                    "%Y-%m-%d"
-                ),
-                "plannedenddate": (datetime.now() + timedelta(days=240)).strftime(
-                    "%Y-%m-%d"
-                ),
-                "dataproviderid_fk": "org-001",
-                "datasensitivitylevel": "restricted",  
-            },
-            {
-                "systemid": "prg-002",
-                "programmename": "Yorkshire Clean Water Investment Programme",
-                "programmetype": "capital_investment",  
-                "programmedescription": "Major investment to improve water quality and reduce leakage",
-                "plannedstartdate": (datetime.now() + timedelta(days=90)).strftime(
-                    "%Y-%m-%d"
-                ),
-                "plannedenddate": (datetime.now() + timedelta(days=365)).strftime(
-                    "%Y-%m-%d"
-                ),
-                "dataproviderid_fk": "org-002",
-                "datasensitivitylevel": "public",  
-            },
-            {
-                "systemid": "prg-003",
-                "programmename": "Smart Grid Upgrade Programme",
-                "programmetype": "network_reinforcement",  
-                "programmedescription": "Installation of smart meters and grid monitoring equipment",
-                "plannedstartdate": (datetime.now() + timedelta(days=30)).strftime(
-                    "%Y-%m-%d"
-                ),
-                "plannedenddate": (datetime.now() + timedelta(days=180)).strftime(
-                    "%Y-%m-%d"
-                ),
-                "dataproviderid_fk": "org-003",
-                "datasensitivitylevel": "restricted",  
-            },
-            {
-                "systemid": "prg-004",
-                "programmename": "Fibre to the Premises Rollout - Leeds",
-                "programmetype": "network_expansion",  
-                "programmedescription": "FTTP deployment to residential and business premises",
-                "plannedstartdate": (datetime.now() + timedelta(days=45)).strftime(
-                    "%Y-%m-%d"
-                ),
-                "plannedenddate": (datetime.now() + timedelta(days=300)).strftime(
-                    "%Y-%m-%d"
-                ),
-                "dataproviderid_fk": "org-004",
-                "datasensitivitylevel": "public",  
-            },
-            {
-                "systemid": "prg-005",
-                "programmename": "Leeds City Centre Cycling Infrastructure Development",
-                "programmetype": "cycle_network_development",  
-                "programmedescription": "Development of segregated cycle routes in the city center",
-                "plannedstartdate": (datetime.now() + timedelta(days=120)).strftime(
-                    "%Y-%m-%d"
-                ),
-                "plannedenddate": (datetime.now() + timedelta(days=365)).strftime(
-                    "%Y-%m-%d"
-                ),
-                "dataproviderid_fk": "org-005",
-                "datasensitivitylevel": "public",  
-            },
+            (
+                "prg-001",
+                "Leeds City Centre Gas Main Replacement 2025",
+                "asset_replacement",  
+                "Replacement of aging cast iron mains with modern PE pipes in Leeds city centre",
+                date_at[60],
+                date_at[240],
+                "org-001",
+                "restricted",  
+            ),
+            (
+                "prg-002",
+                "Yorkshire Clean Water Investment Programme",
+                "capital_investment",  
+                "Major investment to improve water quality and reduce leakage",
+                date_at[90],
+                date_at[365],
+                "org-002",
+                "public",  
+            ),
+            (
+                "prg-003",
+                "Smart Grid Upgrade Programme",
+                "network_reinforcement",  
+                "Installation of smart meters and grid monitoring equipment",
+                date_at[30],
+                date_at[180],
+                "org-003",
+                "restricted",  
+            ),
+            (
+                "prg-004",
+                "Fibre to the Premises Rollout - Leeds",
+                "network_expansion",  
+                "FTTP deployment to residential and business premises",
+                date_at[45],
+                date_at[300],
+                "org-004",
+                "public",  
+            ),
+            (
+                "prg-005",
+                "Leeds City Centre Cycling Infrastructure Development",
+                "cycle_network_development",  
+                "Development of segregated cycle routes in the city center",
+                date_at[120],
+                date_at[365],
+                "org-005",
+                "public",  
+            ),
         ]
 
-        for prog_data in programmes:
-            feature = ogr.Feature(layer.GetLayerDefn())
-            for field, value in prog_data.items():
-                feature.SetField(field, value)
-            feature.SetField("lifecyclestatus", "active")  
-            feature.SetField("datelastupdated", datetime.now().isoformat())
-            feature.SetField("dateoflastlifecyclestatuschange", datetime.now().isoformat())
-            feature.SetField("systemloaddate", datetime.now().isoformat())
-            feature.SetField("certification", "Provisional")
-            feature.SetField("dataproviderassigneduniqueid", prog_data["systemid"])
-            feature.SetField("dataproviderassigneduniqueidautoassigned", 1)
-            layer.CreateFeature(feature)
-            feature = None
+        # Each programme is a tuple of values in programme_fields order, and
+        # its systemid doubles as the provider's own identifier
+        self._insert_rows(
+            "plannedprogramme",
+            programme_fields + ("dataproviderassigneduniqueid",),
+            [programme + (programme[0],) for programme in programmes],
+        )
 
     def _populate_network_links(self):
         """Populate network links with line geometries and USRN references"""
-        print("Populating network links...")
-        assert self.ds is not None
+        logger.info("Populating network links...")
+
+        now_iso = self._now_iso
+        date_at = self._date_at
 
         layer = self.ds.GetLayerByName("networklink")
 
+        # Resolve the field indexes once rather than by name on every SetField
+        defn = layer.GetLayerDefn()
+        field_index = self._field_indexes(defn)
+
         # Define network links in Leeds area with USRN references
         links = [
             # EXAMPLE 1: Gas main replacement - existing infrastructure being replaced
@@ -325,12 +419,8 @@ class UKFutureWorksProfileGeoPackagePopulate:
                 "plannedinstallationmethod": "open_cut",  
                 "planneddepth_depth": 1.2,
                 "worktype": "full_replacement",  
-                "plannedstartdate": (datetime.now() + timedelta(days=75)).strftime(
-                    "%Y-%m-%d"
-                ),
-                "plannedenddate": (datetime.now() + timedelta(days=90)).strftime(
-                    "%Y-%m-%d"
-                ),
+                "plannedstartdate": date_at[75],
+                "plannedenddate": date_at[90],
                 "confidencelevel": "confirmed",  
                 "usrn": "40701234",
                 "operationalstatus": "in_service", 
@@ -353,12 +443,8 @@ class UKFutureWorksProfileGeoPackagePopulate:
                 "plannedinstallationmethod": "directional_drilling",  
                 "planneddepth_depth": 1.5,
                 "worktype": "new_installation",  
-                "plannedstartdate": (datetime.now() + timedelta(days=80)).strftime(
-                    "%Y-%m-%d"
-                ),
-                "plannedenddate": (datetime.now() + timedelta(days=95)).strftime(
-                    "%Y-%m-%d"
-                ),
+                "plannedstartdate": date_at[80],
+                "plannedenddate": date_at[95],
                 "confidencelevel": "highly_likely",  
                 "usrn": "40701235",
                 "operationalstatus": "proposed",  
@@ -381,12 +467,8 @@ class UKFutureWorksProfileGeoPackagePopulate:
                 "plannedinstallationmethod": "open_cut",  
                 "planneddepth_depth": 1.0,
                 "worktype": "full_replacement",  
-                "plannedstartdate": (datetime.now() + timedelta(days=100)).strftime(
-                    "%Y-%m-%d"
-                ),
-                "plannedenddate": (datetime.now() + timedelta(days=130)).strftime(
-                    "%Y-%m-%d"
-                ),
+                "plannedstartdate": date_at[100],
+                "plannedenddate": date_at[130],
                 "confidencelevel": "highly_likely",  
                 "usrn": "40705678",
                 "operationalstatus": "unfit_for_service",  
@@ -409,12 +491,8 @@ class UKFutureWorksProfileGeoPackagePopulate:
                 "plannedinstallationmethod": "moling",  
                 "planneddepth_depth": 0.8,
                 "worktype": "new_installation",  
-                "plannedstartdate": (datetime.now() + timedelta(days=45)).strftime(
-                    "%Y-%m-%d"
-                ),
-                "plannedenddate": (datetime.now() + timedelta(days=50)).strftime(
-                    "%Y-%m-%d"
-                ),
+                "plannedstartdate": date_at[45],
+                "plannedenddate": date_at[50],
                 "confidencelevel": "confirmed",  
                 "usrn": "40702345",
                 "operationalstatus": "under_construction",  
@@ -437,12 +515,8 @@ class UKFutureWorksProfileGeoPackagePopulate:
                 "plannedinstallationmethod": "directional_drilling",  
                 "planneddepth_depth": 1.5,
                 "worktype": "removal",  
-                "plannedstartdate": (datetime.now() + timedelta(days=45)).strftime(
-                    "%Y-%m-%d"
-                ),
-                "plannedenddate": (datetime.now() + timedelta(days=60)).strftime(
-                    "%Y-%m-%d"
-                ),
+                "plannedstartdate": date_at[45],
+                "plannedenddate": date_at[60],
                 "confidencelevel": "confirmed",  
                 "usrn": "40703456",
                 "operationalstatus": "abandoned",  
@@ -465,12 +539,8 @@ class UKFutureWorksProfileGeoPackagePopulate:
                 "plannedinstallationmethod": "open_cut",  
                 "planneddepth_depth": 0.6,
                 "worktype": "new_installation",  
-                "plannedstartdate": (datetime.now() + timedelta(days=50)).strftime(
-                    "%Y-%m-%d"
-                ),
-                "plannedenddate": (datetime.now() + timedelta(days=55)).strftime(
-                    "%Y-%m-%d"
-                ),
+                "plannedstartdate": date_at[50],
+                "plannedenddate": date_at[55],
                 "confidencelevel": "likely",  
                 "usrn": "40704567",
                 "operationalstatus": "proposed",
@@ -492,12 +562,8 @@ class UKFutureWorksProfileGeoPackagePopulate:
                 "plannedinstallationmethod": "moling",  
                 "planneddepth_depth": 0.6,
                 "worktype": "new_installation",  
-                "plannedstartdate": (datetime.now() + timedelta(days=60)).strftime(
-                    "%Y-%m-%d"
-                ),
-                "plannedenddate": (datetime.now() + timedelta(days=75)).strftime(
-                    "%Y-%m-%d"
-                ),
+                "plannedstartdate": date_at[60],
+                "plannedenddate": date_at[75],
                 "confidencelevel": "likely",  
                 "usrn": "40706789",
                 "operationalstatus": "proposed",
@@ -519,12 +585,8 @@ class UKFutureWorksProfileGeoPackagePopulate:
                 "plannedinstallationmethod": "other",  
                 "planneddepth_depth": 0.5,
                 "worktype": "full_replacement",  
-                "plannedstartdate": (datetime.now() + timedelta(days=65)).strftime(
-                    "%Y-%m-%d"
-                ),
-                "plannedenddate": (datetime.now() + timedelta(days=70)).strftime(
-                    "%Y-%m-%d"
-                ),
+                "plannedstartdate": date_at[65],
+                "plannedenddate": date_at[70],
                 "confidencelevel": "highly_likely",  
                 "usrn": "40707890",
                 "operationalstatus": "in_service",
@@ -547,12 +609,8 @@ class UKFutureWorksProfileGeoPackagePopulate:
                 "plannedinstallationmethod": "open_cut",  
                 "planneddepth_depth": 0.3,
                 "worktype": "new_installation",  
-                "plannedstartdate": (datetime.now() + timedelta(days=120)).strftime(
-                    "%Y-%m-%d"
-                ),
-                "plannedenddate": (datetime.now() + timedelta(days=180)).strftime(
-                    "%Y-%m-%d"
-                ),
+                "plannedstartdate": date_at[120],
+                "plannedenddate": date_at[180],
                 "confidencelevel": "likely",  
                 "usrn": "40701236",
                 "operationalstatus": "proposed",
@@ -576,12 +634,8 @@ class UKFutureWorksProfileGeoPackagePopulate:
                 "plannedinstallationmethod": "open_cut",  
                 "planneddepth_depth": 1.0,
                 "worktype": "relocation",  
-                "plannedstartdate": (datetime.now() + timedelta(days=150)).strftime(
-                    "%Y-%m-%d"
-                ),
-                "plannedenddate": (datetime.now() + timedelta(days=200)).strftime(
-                    "%Y-%m-%d"
-                ),
+                "plannedstartdate": date_at[150],
+                "plannedenddate": date_at[200],
                 "confidencelevel": "possible",  
                 "usrn": "40709012",
                 "operationalstatus": "in_service",
@@ -595,105 +649,262 @@ class UKFutureWorksProfileGeoPackagePopulate:
             },
         ]
 
-        for link_data in links:
-            feature = ogr.Feature(layer.GetLayerDefn())
+        # Insert the links in Hilbert curve order of their centres, so lines
+        # that are near each other are stored together and the RTree built
+        # over them afterwards has tighter nodes
+        links = self._hilbert_sorted(links)
+
+        # CreateFeature copies the feature into the layer, so a single feature
+        # is reused for every row: fields that are the same on every row are
+        # set once here, and each row overwrites only its own fields. Fields
+        # left unset, such as featuretype, take their schema defaults
+        feature = ogr.Feature(defn)
+        feature.SetField(field_index["lifecyclestatus"], "active")
+        feature.SetField(field_index["datelastupdated"], now_iso)
+        feature.SetField(field_index["dateoflastlifecyclestatuschange"], now_iso)
+        feature.SetField(field_index["systemloaddate"], now_iso)
+        feature.SetField(field_index["datasensitivitylevel"], "public")
+
+        # Links don't all carry the same keys, so every row sets or clears
+        # each of them to keep values from carrying over between rows
+        link_fields = [
+            (field_index[field], field)
+            for field in dict.fromkeys(key for link in links for key in link)
+            if field != "coords"
+        ]
+        # Bound once, as this builder makes the most SetField calls
+        set_field = feature.SetField
+
+        # Fields derived from other link values, resolved once for all rows
+        componenttype_index = field_index["componenttype"]
+        installationdate_index = field_index["plannedinstallationdate"]
+        owner_indexes = (
+            field_index["dataowner"],
+            field_index["operator"],
+            field_index["objectowner"],
+        )
+
+        def build_feature(link_data):
+            # Clear the FID the previous CreateFeature assigned
+            feature.SetFID(ogr.NullFID)
 
             # Set all fields except geometry
-            for field, value in link_data.items():
-                if field != "coords" and value is not None:
-                    feature.SetField(field, value)
+            for index, field in link_fields:
+                value = link_data.get(field)
+                if value is None:
+                    feature.UnsetField(index)
+                else:
+                    set_field(index, value)
             
-            # Set standard fields
-            feature.SetField("lifecyclestatus", "active")  
-            feature.SetField("datelastupdated", datetime.now().isoformat())
-            feature.SetField("dateoflastlifecyclestatuschange", datetime.now().isoformat())
-            feature.SetField("systemloaddate", datetime.now().isoformat())
-            feature.SetField("planneddepth_unitofmeasure", "metres")  
-            feature.SetField("datasensitivitylevel", "public")  
-            feature.SetField("featuretype", "NetworkLink")
-            feature.SetField("componenttype", link_data["utilitytype"])
-            feature.SetField("plannedinstallationdate", link_data["plannedstartdate"])
+            set_field(componenttype_index, link_data["utilitytype"])
+            set_field(installationdate_index, link_data["plannedstartdate"])
 
             # Set data owner to match data provider
-            feature.SetField("dataowner", link_data["dataproviderid_fk"])
-            feature.SetField("operator", link_data["dataproviderid_fk"])
-            feature.SetField("objectowner", link_data["dataproviderid_fk"])
-
-            # Create line geometry
-            line = ogr.Geometry(ogr.wkbLineString)
-            for coord in link_data["coords"]:
-                line.AddPoint(coord[0], coord[1])
-
-            feature.SetGeometry(line)
-            layer.CreateFeature(feature)
-            feature = None
-
-    def _populate_unified_table(self):
-        """Populate the unified future works table with all joined data"""
-        print("Creating unified future works table...")
+            owner = link_data["dataproviderid_fk"]
+            for index in owner_indexes:
+                set_field(index, owner)
+
+            # Create line geometry; the feature takes ownership of the new
+            # geometry rather than copying it
+            feature.SetGeometryDirectly(self._linestring(link_data["coords"]))
+            return feature
+
+        self._bulk_insert(layer, links, build_feature)
+
+    def _hilbert_sorted(self, links):
+        """Return the links ordered along a Hilbert curve through their centres"""
+        centres = [
+            (
+                sum(x for x, _ in link["coords"]) / len(link["coords"]),
+                sum(y for _, y in link["coords"]) / len(link["coords"]),
+            )
+            for link in links
+        ]
+        min_x = min(x for x, _ in centres)
+        min_y = min(y for _, y in centres)
+        span = max(
+            max(x for x, _ in centres) - min_x, max(y for _, y in centres) - min_y
+        )
+
+        # Scale the centres onto the curve's grid, keeping the aspect ratio
+        side = 1 << 16
+        scale = (side - 1) / span if span else 0
+        keys = [
+            self._hilbert_index(
+                int((x - min_x) * scale), int((y - min_y) * scale), side
+            )
+            for x, y in centres
+        ]
+        return [links[i] for _, i in sorted(zip(keys, range(len(links))))]
+
+    def _hilbert_index(self, x, y, side):
+        """Distance along the Hilbert curve of a cell in a side x side grid"""
+        distance = 0
+        s = side // 2
+        while s > 0:
+            rx = 1 if x & s else 0
+            ry = 1 if y & s else 0
+            distance += s * s * ((3 * rx) ^ ry)
+            # Rotate the quadrant so the curve continues from this cell
+            if ry == 0:
+                if rx == 1:
+                    x = side - 1 - x
+                    y = side - 1 - y
+                x, y = y, x
+            s //= 2
+        return distance
+
+    def _linestring(self, coords):
+        """Build a 2D line geometry from (x, y) pairs in a single call"""
+        # Little-endian WKB: byte order, geometry type, point count, then
+        # the coordinates, rather than one AddPoint call per vertex
+        count = len(coords)
+        header = self._WKB_HEADERS.get(count)
+        if header is None:
+            header = struct.pack("<BII", 1, ogr.wkbLineString, count)
+            self._WKB_HEADERS[count] = header
+        wkb = header + struct.pack(f"<{2 * count}d", *(v for xy in coords for v in xy))
+        return ogr.CreateGeometryFromWkb(wkb)
+
+    def _insert_rows(self, table_name, columns, rows):
+        """Insert rows into an attribute table with a single INSERT statement
+
+        Every table starts with the common header, so each row is marked
+        active with the run's load timestamp; columns left out, such as a
+        programme's certification, take the defaults the schema declares.
+        The caller owns the transaction the rows are inserted in.
+        """
         assert self.ds is not None
 
-        sql = """
-        INSERT INTO future_works_unified (
-            work_id, work_name, description, 
-            organisation_name, organisation_shortname, organisation_type, swa_code,
-            utility_type, utility_subtype, conveyance_method, usrn, street_name, work_type,
-            planned_start_date, planned_end_date, confidence_level,
-            material, installation_method, depth_metres,
-            programme_name, programme_type,
-            contact_name, contact_email, contact_phone,
-            last_updated, data_sensitivity, operational_status, geom,
-            scheme_status, cycle_scheme_details
+        constants = {
+            "lifecyclestatus": "active",
+            "datelastupdated": self._now_iso,
+            "dateoflastlifecyclestatuschange": self._now_iso,
+            "systemloaddate": self._now_iso,
+        }
+
+        self.ds.ExecuteSQL(
+            insert_rows_sql(table_name, columns, rows, constants), dialect="SQLITE"
         )
-        SELECT 
-            nl.systemid as work_id,
-            nl.objectname as work_name,
-            nl.description,
-            org.name as organisation_name,
-            org.shortname as organisation_shortname,
-            org.organisationtype as organisation_type,
-            org.swacode as swa_code,
-            nl.utilitytype as utility_type,
-            nl.utilitysubtype as utility_subtype,
-            nl.conveyancemethod as conveyance_method,
-            nl.usrn,
-            nl.localereference as street_name,
-            nl.worktype as work_type,
-            nl.plannedstartdate as planned_start_date,
-            nl.plannedenddate as planned_end_date,
-            nl.confidencelevel as confidence_level,
-            nl.plannedmaterial as material,
-            nl.plannedinstallationmethod as installation_method,
-            nl.planneddepth_depth as depth_metres,
-            prog.programmename as programme_name,
-            prog.programmetype as programme_type,
-            cd.contactdetailstype || ' - ' || cd.departmentname as contact_name,
-            cd.emailaddress as contact_email,
-            cd.telephonenumber as contact_phone,
-            nl.datelastupdated as last_updated,
-            nl.datasensitivitylevel as data_sensitivity,
-            nl.operationalstatus as operational_status,
-            nl.geom,
-            nl.schemestatus as scheme_status,
-            nl.cycleschemedetails as cycle_scheme_details
-        FROM networklink nl
-        LEFT JOIN organisation org ON nl.dataproviderid_fk = org.systemid
-        LEFT JOIN plannedprogramme prog ON nl.programmeid_fk = prog.systemid
-        LEFT JOIN relationship_organisationtocontactdetails rel ON org.systemid = rel.linkedorganisationid
-        LEFT JOIN contactdetails cd ON rel.linkedcontactdetailsid = cd.systemid
-        WHERE nl.lifecyclestatus = 'active'
+
+    def _bulk_insert(self, layer, records, build_feature):
+        """Create a feature for each record
+
+        The caller owns the transaction the features are created in, so they
+        are not each committed, and synced, on their own.
+        """
+        create_feature = layer.CreateFeature
+        for record in records:
+            create_feature(build_feature(record))
+
+    def _field_indexes(self, defn):
+        """Map each field name of a layer definition to its index"""
+        return {defn.GetFieldDefn(i).GetName(): i for i in range(defn.GetFieldCount())}
+
+    def finalize_spatial_indexes(self):
+        """Bulk build the RTree spatial indexes for the geometry tables
+
+        Called at the end of populate_geopackage; callers that load the
+        GeoPackage by other means can call it once their load is finished.
+        Tables that already have a spatial index are skipped, so it is safe
+        to call again. Without an open GeoPackage it opens one with the
+        normal, durable settings and closes it afterwards.
+        """
+        logger.info("Creating spatial indexes...")
+        owns_ds = self.ds is None
+        if owns_ds:
+            self.ds = self._open(bulk_load=False)
+
+        try:
+            # The geometry tables are created without a spatial index so that
+            # inserts don't pay for RTree maintenance; build each index in one
+            # go, unless an earlier run already has
+            for table_name in ("networklink",):
+                ((has_index,),) = self._query(
+                    f"SELECT HasSpatialIndex('{table_name}', 'geom')"
+                )
+                if has_index:
+                    continue
+                result = self.ds.ExecuteSQL(
+                    f"SELECT gpkgAddSpatialIndex('{table_name}', 'geom')",
+                    dialect="SQLITE",
+                )
+                if result is not None:
+                    self.ds.ReleaseResultSet(result)
+        finally:
+            if owns_ds:
+                self._close()
+
+    def _query(self, sql):
+        """Run a SQL query and return its rows as tuples of field values
+
+        The query is handed straight to SQLite so its planner, rather than
+        OGR SQL, decides how to use the indexes. With debug logging enabled
+        the plan SQLite chose is logged as well.
         """
+        assert self.ds is not None
+
+        if logger.isEnabledFor(logging.DEBUG):
+            plan = self.ds.ExecuteSQL(f"EXPLAIN QUERY PLAN {sql}", dialect="SQLITE")
+            try:
+                for step in plan:
+                    logger.debug("Query plan: %s", step.GetField("detail"))
+            finally:
+                self.ds.ReleaseResultSet(plan)
+
+        result = self.ds.ExecuteSQL(sql, dialect="SQLITE")
+        try:
+            return [
+                tuple(feature.GetField(i) for i in range(feature.GetFieldCount()))
+                for feature in result
+            ]
+        finally:
+            self.ds.ReleaseResultSet(result)
 
-        self.ds.ExecuteSQL(sql)
-        print("Unified table populated successfully!")
+    def _print_distribution(self, counts, out):
+        """Write (value, count) pairs, one line per value, in the order given"""
+        out.writelines(f"{value:<30} {count:>5} links\n" for value, count in counts)
 
     def generate_summary_report(self):
         """Generate a summary report of the populated data"""
-        print("\n" + "=" * 60)
-        print("MUDDI NETWORK LINK GEOPACKAGE POPULATION SUMMARY")
-        print("=" * 60)
+        # The report is built up in memory and written to stdout in one go
+        out = io.StringIO()
+
+        print("\n" + SEPARATOR, file=out)
+        print("MUDDI NETWORK LINK GEOPACKAGE POPULATION SUMMARY", file=out)
+        print(SEPARATOR, file=out)
+
+        # Reuse the open GeoPackage inside a with block. Otherwise the report
+        # only reads a GeoPackage nothing else is writing to, so SQLite's
+        # file locking can be skipped
+        owns_ds = self.ds is None
+        if owns_ds:
+            try:
+                self.ds = gdal.OpenEx(
+                    self.geopackage_path,
+                    gdal.OF_VECTOR | gdal.OF_READONLY,
+                    open_options=["NOLOCK=YES"],
+                )
+            except RuntimeError as e:
+                raise OSError(
+                    f"Failed to open GeoPackage: {self.geopackage_path}: {e}"
+                ) from e
+
+        try:
+            self._write_summary_report(out)
+        except Exception as e:
+            logger.error("Error generating summary report: %s", e)
+            raise
+        finally:
+            if owns_ds:
+                self.ds = None
+
+        print("\n" + SEPARATOR, file=out)
+        sys.stdout.write(out.getvalue())
 
-        self.ds = ogr.Open(self.geopackage_path, 0)  
+    def _write_summary_report(self, out):
+        """Write the table counts and network link summary to out"""
+        assert self.ds is not None
 
         tables = [
             "organisation",
@@ -704,154 +915,125 @@ class UKFutureWorksProfileGeoPackagePopulate:
             "future_works_unified",
         ]
 
-        print(f"\nGeoPackage: {self.geopackage_path}")
-        print(f"Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("\nTable Record Counts:")
-        print("-" * 40)
+        print(f"\nGeoPackage: {self.geopackage_path}", file=out)
+        print(f"Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", file=out)
+        print("\nTable Record Counts:", file=out)
+        print("-" * 40, file=out)
 
-        for table_name in tables:
-            layer = self.ds.GetLayerByName(table_name)
-            if layer:
-                count = layer.GetFeatureCount()
-                print(f"{table_name:<40} {count:>5} records")
+        # Count every table that exists in one query, keeping the order above
+        counts_sql = " UNION ALL ".join(
+            f"SELECT '{table_name}', COUNT(*) FROM {table_name}"
+            for table_name in tables
+            if self.ds.GetLayerByName(table_name)
+        )
+        if counts_sql:
+            for table_name, count in self._query(counts_sql):
+                print(f"{table_name:<40} {count:>5} records", file=out)
+
+        print("\nNetwork Link Summary:", file=out)
+        print("-" * 40, file=out)
+
+        # Get network links summary; the counts and aggregates below are
+        # computed by SQLite rather than by reading every feature into Python,
+        # and each distribution lists its most common values first
+        if self.ds.GetLayerByName("networklink"):
+            ((active_count, earliest, latest),) = self._query(
+                "SELECT COUNT(*), MIN(plannedstartdate), MAX(plannedstartdate) "
+                "FROM networklink WHERE lifecyclestatus = 'active'"
+            )
+            print(f"Active network links: {active_count}", file=out)
 
-        print("\nNetwork Link Summary:")
-        print("-" * 40)
+            # Get date range
+            if earliest:
+                print(f"Earliest planned start: {earliest}", file=out)
+                print(f"Latest planned start: {latest}", file=out)
 
-        # Get network links summary
-        layer = self.ds.GetLayerByName("networklink")
-        if layer:
-            layer.SetAttributeFilter("lifecyclestatus = 'active'")
-            active_count = layer.GetFeatureCount()
-            print(f"Active network links: {active_count}")
+            print("\nUtility Type Distribution:", file=out)
+            print("-" * 40, file=out)
 
-            # Get date range
-            layer.ResetReading()
-            dates = []
-            for feature in layer:
-                start_date = feature.GetField("plannedstartdate")
-                if start_date:
-                    dates.append(start_date)
-
-            if dates:
-                print(f"Earliest planned start: {min(dates)}")
-                print(f"Latest planned start: {max(dates)}")
-
-            print("\nUtility Type Distribution:")
-            print("-" * 40)
-
-            layer.ResetReading()
-            layer.SetAttributeFilter(None)  # Remove filter
-            utility_counts = {}
-            for feature in layer:
-                utility_type = feature.GetField("utilitytype")
-                utility_counts[utility_type] = utility_counts.get(utility_type, 0) + 1
-
-            for utility_type, count in sorted(utility_counts.items()):
-                print(f"{utility_type:<30} {count:>5} links")
-
-
-            print("\nOperational Status Distribution:")
-            print("-" * 40)
-
-            layer.ResetReading()
-            status_counts = {}
-            for feature in layer:
-                operational_status = feature.GetField("operationalstatus")
-                status_counts[operational_status] = status_counts.get(operational_status, 0) + 1
-
-            for status, count in sorted(status_counts.items()):
-                print(f"{status:<30} {count:>5} links")
-
-            print("\nScheme Status Distribution:")
-            print("-" * 40)
-
-            layer.ResetReading()
-            scheme_counts = {}
-            for feature in layer:
-                scheme_status = feature.GetField("schemestatus")
-                scheme_counts[scheme_status] = scheme_counts.get(scheme_status, 0) + 1
-
-            for status, count in sorted(scheme_counts.items()):
-                print(f"{status:<30} {count:>5} links")
-
-            print("\nConveyance Method Distribution:")
-            print("-" * 40)
-
-            layer.ResetReading()
-            method_counts = {}
-            for feature in layer:
-                conveyance_method = feature.GetField("conveyancemethod")
-                method_counts[conveyance_method] = method_counts.get(conveyance_method, 0) + 1
-
-            for method, count in sorted(method_counts.items()):
-                print(f"{method:<30} {count:>5} links")
-
-            print("\nWork Type Distribution:")
-            print("-" * 40)
-
-            layer.ResetReading()
-            worktype_counts = {}
-            for feature in layer:
-                work_type = feature.GetField("worktype")
-                worktype_counts[work_type] = worktype_counts.get(work_type, 0) + 1
-
-            for work_type, count in sorted(worktype_counts.items()):
-                print(f"{work_type:<30} {count:>5} links")
-
-            print("\nOrganisation Distribution:")
-            print("-" * 40)
-
-            layer.ResetReading()
-            org_counts = {}
-            org_layer = self.ds.GetLayerByName("organisation")
-
-            # Build org lookup
-            org_names = {}
-            org_layer.ResetReading()
-            for feature in org_layer:
-                org_names[feature.GetField("systemid")] = feature.GetField("name")
-
-            # Count by organisation
-            layer.ResetReading()
-            for feature in layer:
-                org_id = feature.GetField("dataproviderid_fk")
-                org_name = org_names.get(org_id, "Unknown")
-                org_counts[org_name] = org_counts.get(org_name, 0) + 1
-
-            for org_name, count in sorted(org_counts.items()):
-                print(f"{org_name:<30} {count:>5} links")
-
-            print("\nData Quality Check:")
-            print("-" * 40)
-
-            layer.ResetReading()
-            missing_operational_status = 0
-            missing_scheme_status = 0
-            missing_confidence_level = 0
-            missing_usrn = 0
-
-            for feature in layer:
-                if not feature.GetField("operationalstatus"):
-                    missing_operational_status += 1
-                if not feature.GetField("schemestatus"):
-                    missing_scheme_status += 1
-                if not feature.GetField("confidencelevel"):
-                    missing_confidence_level += 1
-                if not feature.GetField("usrn"):
-                    missing_usrn += 1
-
-            print(f"Missing operational status: {missing_operational_status}")
-            print(f"Missing scheme status: {missing_scheme_status}")
-            print(f"Missing confidence level: {missing_confidence_level}")
-            print(f"Missing USRN: {missing_usrn}")
+            utility_counts = self._query(
+                "SELECT utilitytype, COUNT(*) FROM networklink "
+                "GROUP BY utilitytype ORDER BY 2 DESC, 1"
+            )
 
-        self.ds = None
-        print("\n" + "=" * 60)
+            self._print_distribution(utility_counts, out)
+
+            print("\nOperational Status Distribution:", file=out)
+            print("-" * 40, file=out)
+
+            status_counts = self._query(
+                "SELECT operationalstatus, COUNT(*) FROM networklink "
+                "GROUP BY operationalstatus ORDER BY 2 DESC, 1"
+            )
+
+            self._print_distribution(status_counts, out)
+
+            print("\nScheme Status Distribution:", file=out)
+            print("-" * 40, file=out)
+
+            scheme_counts = self._query(
+                "SELECT schemestatus, COUNT(*) FROM networklink "
+                "GROUP BY schemestatus ORDER BY 2 DESC, 1"
+            )
+
+            self._print_distribution(scheme_counts, out)
+
+            print("\nConveyance Method Distribution:", file=out)
+            print("-" * 40, file=out)
+
+            method_counts = self._query(
+                "SELECT conveyancemethod, COUNT(*) FROM networklink "
+                "GROUP BY conveyancemethod ORDER BY 2 DESC, 1"
+            )
+
+            self._print_distribution(method_counts, out)
+
+            print("\nWork Type Distribution:", file=out)
+            print("-" * 40, file=out)
+
+            worktype_counts = self._query(
+                "SELECT worktype, COUNT(*) FROM networklink "
+                "GROUP BY worktype ORDER BY 2 DESC, 1"
+            )
+
+            self._print_distribution(worktype_counts, out)
+
+            print("\nOrganisation Distribution:", file=out)
+            print("-" * 40, file=out)
+
+            # Count by organisation, resolving each provider to its name
+            org_counts = self._query(
+                "SELECT COALESCE(o.name, 'Unknown') AS org_name, COUNT(*) "
+                "FROM networklink nl "
+                "LEFT JOIN organisation o ON o.systemid = nl.dataproviderid_fk "
+                "GROUP BY org_name ORDER BY 2 DESC, 1"
+            )
+
+            self._print_distribution(org_counts, out)
+
+            print("\nData Quality Check:", file=out)
+            print("-" * 40, file=out)
+
+            # Count the null or empty values of each column in one pass; a
+            # column's non-empty count is COUNT of its NULLIF with ''
+            (missing_counts,) = self._query(
+                "SELECT COUNT(*) - COUNT(NULLIF(operationalstatus, '')), "
+                "COUNT(*) - COUNT(NULLIF(schemestatus, '')), "
+                "COUNT(*) - COUNT(NULLIF(confidencelevel, '')), "
+                "COUNT(*) - COUNT(NULLIF(usrn, '')) "
+                "FROM networklink"
+            )
+
+            labels = ("operational status", "scheme status", "confidence level", "USRN")
+            for label, count in zip(labels, missing_counts):
+                print(f"Missing {label}: {count}", file=out)
 
 
 def main():
     """Main function"""
+    # Progress is logged to stdout alongside the printed output
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
     # Default GeoPackage path
     geopackage_path = "uk_future_works_example.gpkg"
 
@@ -859,19 +1041,19 @@ def main():
     if len(sys.argv) > 1:
         geopackage_path = sys.argv[1]
 
-    # Check if GeoPackage exists
-    if not os.path.exists(geopackage_path):
-        print(f"Error: GeoPackage not found: {geopackage_path}")
+    # Populate the GeoPackage and report on it over a single connection;
+    # opening it is also the check that it exists
+    try:
+        with UKFutureWorksProfileGeoPackagePopulate(geopackage_path) as populator:
+            populator.populate_geopackage()
+
+            # Generate summary report
+            populator.generate_summary_report()
+    except OSError as e:
+        print(f"Error: {e}")
         print("Please run the create_uk_future_works_profile.py script first.")
         sys.exit(1)
 
-    # Populate the GeoPackage
-    populator = UKFutureWorksProfileGeoPackagePopulate(geopackage_path)
-    populator.populate_geopackage()
-
-    # Generate summary report
-    populator.generate_summary_report()
-
     print(
         "\nThe GeoPackage has been populated with sample MUDDI-compliant network link data."
     )